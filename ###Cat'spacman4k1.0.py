@@ -18,17 +18,26 @@ HAL Laboratory, Inc.
 """
 
 from __future__ import annotations
-import array
+import functools
 import math
 import random
 import sys
-import time
-from dataclasses import dataclass, field
-from typing import List, Tuple, Dict, Optional
+import threading
+from typing import Callable, List, Tuple, Dict, Optional
 from enum import Enum, auto
 
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the jitted helpers run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
 # ---------------------------------------------------------------------------
 # CONFIGURATION - ARCADE ACCURATE VALUES
 # ---------------------------------------------------------------------------
@@ -36,6 +45,8 @@ import pygame
 TILE_SIZE = 8
 SCALE = 3
 FPS = 60
+IDLE_FPS = 30  # Frame cap for the menu and other static screens
+BLINK_FRAMES = FPS // 2  # Half-second on/off for blinking prompts
 
 # World Dimensions (Arcade: 28x31 playfield)
 MAZE_COLS = 28
@@ -57,10 +68,26 @@ ORANGE = (255, 184, 82)
 BLUE_FRIGHTENED = (33, 33, 255)
 WHITE_FLASH = (255, 255, 255)
 GLITCH_COLORS = [RED, (0, 255, 0), (0, 0, 255), YELLOW, (255, 0, 255), WHITE, BLACK, CYAN, PINK]
+GLITCH_CHARS = ["█", "▓", "░", "▒", "◘", "○", "◙"]
 
 # Audio Settings
 SAMPLE_RATE = 22050
+SAMPLE_PERIOD = 1.0 / SAMPLE_RATE  # Multiply by this instead of dividing
 AUDIO_ENABLED = True
+# Mixer buffer in samples: 2048 is ~93 ms at 22050 Hz, which keeps the
+# callback rate low enough to avoid underruns. 512 is the low-latency
+# fallback for devices that reject the larger buffer.
+MIXER_BUFFER = 2048
+MIXER_BUFFER_FALLBACK = 512
+
+# One period of each NES pulse duty cycle (12.5%, 25%, 50%).
+# Tone generators index these with a phase accumulator instead of
+# evaluating fmod + compare per sample.
+PULSE_LUT_SIZE = 1024
+PULSE_LUTS = {
+    duty: np.where(np.arange(PULSE_LUT_SIZE) < int(PULSE_LUT_SIZE * duty), 1.0, -1.0).astype(np.float32)
+    for duty in (0.125, 0.25, 0.5)
+}
 
 # ---------------------------------------------------------------------------
 # ARCADE-ACCURATE SPEED TABLES (per level)
@@ -110,6 +137,51 @@ FRUIT_TABLE = {
     13: ("key", 5000),
 }
 
+FRUIT_COLORS = {
+    "cherry": RED,
+    "strawberry": RED,
+    "orange": ORANGE,
+    "apple": RED,
+    "melon": (0, 200, 0),
+    "galaxian": YELLOW,
+    "bell": YELLOW,
+    "key": CYAN,
+}
+
+# Per-level lookups flattened into tuples indexed by level (1..MAX_LEVEL,
+# index 0 unused) so the game never probes the sparse tables above
+MAX_LEVEL = 256  # Kill screen
+LEVEL_SPEEDS = (None,) + tuple(
+    SPEED_TABLE.get(min(lvl, 21), SPEED_TABLE[5])  # Speed caps at level 21
+    for lvl in range(1, MAX_LEVEL + 1))
+LEVEL_FRIGHT_TIME = (0,) + tuple(
+    FRIGHT_TIME.get(lvl, 0) for lvl in range(1, MAX_LEVEL + 1))
+LEVEL_MODE_TIMING = (None,) + tuple(
+    MODE_TIMING[1 if lvl == 1 else 2 if lvl < 5 else 5]
+    for lvl in range(1, MAX_LEVEL + 1))
+
+# (pacman, ghost) speeds in tiles per frame, premultiplied by the arcade
+# base speed unit
+BASE_SPEED = 0.1333
+LEVEL_ACTOR_SPEEDS = (None,) + tuple(
+    (BASE_SPEED * speeds[0], BASE_SPEED * speeds[3])
+    for speeds in LEVEL_SPEEDS[1:])
+
+# Frame count standing in for "never" in the mode schedule (-1 chase time)
+MODE_FOREVER = np.iinfo(np.int32).max
+
+
+@functools.lru_cache(maxsize=None)
+def _mode_schedule(level: int) -> Tuple[int, ...]:
+    """Cumulative frame counts at which the scatter/chase mode flips"""
+    durations = []
+    for scatter_time, chase_time in LEVEL_MODE_TIMING[level]:
+        durations.append(scatter_time * FPS)
+        # -1 = chase forever: that switch never comes
+        durations.append(chase_time * FPS if chase_time > 0 else MODE_FOREVER)
+    switch_frames = np.minimum(np.cumsum(durations, dtype=np.int64), MODE_FOREVER)
+    return tuple(switch_frames.tolist())
+
 # Dots needed to release ghosts from pen
 GHOST_RELEASE_DOTS = {
     "PINKY": 0,   # Immediately
@@ -155,49 +227,126 @@ MAZE_LAYOUT = [
     "############################",
 ]
 
+# The layout as a (row, col) byte grid, plus masks of where dots and
+# power pellets start
+MAZE_TILES = np.frombuffer("".join(MAZE_LAYOUT).encode("ascii"),
+                           dtype=np.uint8).reshape(MAZE_ROWS, MAZE_COLS)
+DOT_TILES = MAZE_TILES == ord('.')
+POWER_TILES = MAZE_TILES == ord('o')
+
 # ---------------------------------------------------------------------------
 # AUDIO ENGINE - Procedural Waka Waka
 # ---------------------------------------------------------------------------
 
+# Note envelopes over normalized progress (0..1), keyed by env_kind.
+# Segment lengths are folded into reciprocal multipliers (x / 0.05 -> x * 20)
+NOTE_ENVELOPES = {
+    # Sustain then quick release (death arpeggio)
+    "sustain_release": lambda p: np.where(p < 0.8, 1.0, 1.0 - (p - 0.8) * 5.0),
+    # Quick attack, sustain, quick release (intro melody)
+    "attack_release": lambda p: np.where(p < 0.05, p * 20.0,
+                                         np.where(p > 0.85, (1.0 - p) * (1 / 0.15), 1.0)),
+    # Gentle linear fades (eat ghost / extra life)
+    "fade_30": lambda p: 1.0 - p * 0.3,
+    "fade_20": lambda p: 1.0 - p * 0.2,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _render_note(freq: float, dur: float, duty: float, env_kind: str) -> np.ndarray:
+    """Render one enveloped pulse-wave note at unit amplitude (cached, read-only)"""
+    t = AudioEngine._time_axis(dur)
+    note = AudioEngine._square(freq, t.size, duty) * NOTE_ENVELOPES[env_kind](t * (1.0 / dur))
+    note.flags.writeable = False
+    return note
+
+
 class AudioEngine:
     def __init__(self):
         self.enabled = AUDIO_ENABLED
         if not self.enabled:
             return
         try:
-            pygame.mixer.pre_init(SAMPLE_RATE, -16, 1, 512)
-            pygame.mixer.init()
-            self.sounds = {}
-            self._generate_sounds()
+            # pygame.init() has already opened the mixer with its defaults,
+            # so reopen it as mono at SAMPLE_RATE
+            pygame.mixer.quit()
+            try:
+                pygame.mixer.init(SAMPLE_RATE, -16, 1, MIXER_BUFFER)
+            except pygame.error:
+                pygame.mixer.init(SAMPLE_RATE, -16, 1, MIXER_BUFFER_FALLBACK)
+            self.sounds: Dict[str, pygame.mixer.Sound] = {}
+            self._register_sounds()
+            # Synthesize the first sounds heard off the main thread; the
+            # rest are made on their first play
+            threading.Thread(target=self._prewarm, args=(("waka1", "waka2", "intro"),),
+                             daemon=True).start()
         except Exception as e:
             print(f"Audio init failed: {e}")
             self.enabled = False
 
-    def _generate_sounds(self):
-        """Generate all game sounds procedurally - NES accurate"""
+    def _register_sounds(self):
+        """Register a factory per game sound - NES accurate, made on demand"""
         # NES Pac-Man waka: two alternating square wave tones
         # Waka1: ~261Hz (C4), Waka2: ~196Hz (G3)
         # Duration: ~50ms each, 12.5% duty cycle square wave (NES pulse channel)
-        self.sounds["waka1"] = self._make_nes_waka(261.63, 0.055)
-        self.sounds["waka2"] = self._make_nes_waka(196.00, 0.055)
-        self.sounds["power"] = self._make_power_pellet()
-        self.sounds["death"] = self._make_death()
-        self.sounds["eat_ghost"] = self._make_eat_ghost()
-        self.sounds["fruit"] = self._make_fruit()
-        self.sounds["siren1"] = self._make_siren(1)
-        self.sounds["siren2"] = self._make_siren(2)
-        self.sounds["siren3"] = self._make_siren(3)
-        self.sounds["siren4"] = self._make_siren(4)
-        self.sounds["frightened"] = self._make_frightened()
-        self.sounds["intro"] = self._make_intro()
-        self.sounds["extra_life"] = self._make_extra_life()
+        self.factories: Dict[str, Callable[[], pygame.mixer.Sound]] = {
+            "waka1": lambda: self._make_nes_waka(261.63, 0.055),
+            "waka2": lambda: self._make_nes_waka(196.00, 0.055),
+            "power": self._make_power_pellet,
+            "death": self._make_death,
+            "eat_ghost": self._make_eat_ghost,
+            "fruit": self._make_fruit,
+            "frightened": self._make_frightened,
+            "intro": self._make_intro,
+            "extra_life": self._make_extra_life,
+        }
+        for level in range(1, 5):
+            self.factories[f"siren{level}"] = functools.partial(self._make_siren, level)
         self.waka_toggle = False
         self.current_siren = None
 
-    def _make_sound(self, samples: list) -> pygame.mixer.Sound:
-        """Convert sample list to pygame Sound"""
-        arr = array.array('h', [int(max(-1, min(1, s)) * 32767) for s in samples])
-        return pygame.mixer.Sound(buffer=arr)
+    def _sound(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """Cached sound, synthesized on first use"""
+        sound = self.sounds.get(name)
+        if sound is None:
+            factory = self.factories.get(name)
+            if factory is None:
+                return None
+            # setdefault keeps the first copy if the prewarm thread races us
+            sound = self.sounds.setdefault(name, factory())
+        return sound
+
+    def _prewarm(self, names: Tuple[str, ...]):
+        """Synthesize the given sounds ahead of their first play"""
+        for name in names:
+            self._sound(name)
+
+    def _make_sound(self, samples: np.ndarray) -> pygame.mixer.Sound:
+        """Convert float sample array to pygame Sound"""
+        # Scale into a fresh float32 buffer and clip it in place (inputs may
+        # be read-only cached notes), then hand the int16 bytes to the mixer
+        pcm = np.multiply(samples, 32767, dtype=np.float32)
+        np.clip(pcm, -32767, 32767, out=pcm)
+        return pygame.mixer.Sound(buffer=pcm.astype(np.int16).tobytes())
+
+    @staticmethod
+    def _time_axis(duration: float) -> np.ndarray:
+        """Sample times (seconds) for a buffer of the given duration"""
+        return np.arange(int(SAMPLE_RATE * duration), dtype=np.float32) * SAMPLE_PERIOD
+
+    @staticmethod
+    def _square(freq, n: int, duty: float) -> np.ndarray:
+        """Pulse wave of +/-1 at freq (scalar or per-sample array) read from the duty LUT"""
+        step = PULSE_LUT_SIZE * SAMPLE_PERIOD
+        if np.ndim(freq) == 0:
+            # Constant pitch: phase advances by a fixed step per sample
+            phase = np.arange(n, dtype=np.float64) * (freq * step)
+        else:
+            # Swept pitch: accumulate the per-sample phase increments
+            # (along the last axis, so a 2-D freq renders one wave per row)
+            phase = (np.cumsum(freq, axis=-1, dtype=np.float64) - freq) * step
+        idx = phase.astype(np.int64) & (PULSE_LUT_SIZE - 1)
+        return PULSE_LUTS[duty][idx]
 
     def _make_nes_waka(self, freq: float, duration: float) -> pygame.mixer.Sound:
         """
@@ -205,32 +354,23 @@ class AudioEngine:
         Uses 12.5% duty cycle square wave (NES pulse channel 1 style)
         with quick pitch bend down characteristic of the arcade/NES
         """
-        samples = []
-        n = int(SAMPLE_RATE * duration)
-        
-        for i in range(n):
-            t = i / SAMPLE_RATE
-            progress = t / duration
-            
-            # NES waka has a slight downward pitch bend
-            # Starts at freq, drops ~15% by end
-            current_freq = freq * (1.0 - progress * 0.15)
-            
-            # 12.5% duty cycle square wave (authentic NES pulse sound)
-            # This gives the characteristic "thin" NES sound
-            phase = (t * current_freq) % 1.0
-            duty = 0.125
-            wave = 1.0 if phase < duty else -1.0
-            
-            # Sharp attack, quick exponential decay (NES envelope style)
-            if progress < 0.05:
-                env = progress / 0.05  # Quick attack
-            else:
-                env = math.exp(-4.0 * (progress - 0.05))  # Fast decay
-            
-            samples.append(wave * env * 0.4)
-        
-        return self._make_sound(samples)
+        t = self._time_axis(duration)
+        progress = t * (1.0 / duration)
+
+        # NES waka has a slight downward pitch bend
+        # Starts at freq, drops ~15% by end
+        current_freq = freq * (1.0 - progress * 0.15)
+
+        # 12.5% duty cycle square wave (authentic NES pulse sound)
+        # This gives the characteristic "thin" NES sound
+        wave = self._square(current_freq, t.size, 0.125)
+
+        # Sharp attack, quick exponential decay (NES envelope style)
+        env = np.where(progress < 0.05,
+                       progress * 20.0,                       # Quick attack
+                       np.exp(-4.0 * (progress - 0.05)))      # Fast decay
+
+        return self._make_sound(wave * env * 0.4)
 
     def _make_waka(self, freq: float, duration: float) -> pygame.mixer.Sound:
         """Legacy waka - redirects to NES version"""
@@ -238,34 +378,23 @@ class AudioEngine:
 
     def _make_power_pellet(self) -> pygame.mixer.Sound:
         """NES power pellet eaten sound - ascending square wave sweep"""
-        samples = []
-        n = int(SAMPLE_RATE * 0.25)
-        for i in range(n):
-            t = i / SAMPLE_RATE
-            progress = t / 0.25
-            
-            # Ascending frequency sweep
-            f = 200 + progress * 600
-            
-            # 25% duty square wave
-            phase = (t * f) % 1.0
-            wave = 1.0 if phase < 0.25 else -1.0
-            
-            # Quick attack, sustain, quick release
-            if progress < 0.1:
-                env = progress / 0.1
-            elif progress > 0.85:
-                env = (1.0 - progress) / 0.15
-            else:
-                env = 1.0
-            
-            samples.append(wave * env * 0.35)
-        return self._make_sound(samples)
+        t = self._time_axis(0.25)
+        progress = t * 4.0  # / 0.25 s
+
+        # Ascending frequency sweep
+        f = 200 + progress * 600
+
+        # 25% duty square wave
+        wave = self._square(f, t.size, 0.25)
+
+        # Quick attack, sustain, quick release
+        env = np.where(progress < 0.1, progress * 10.0,
+                       np.where(progress > 0.85, (1.0 - progress) * (1 / 0.15), 1.0))
+
+        return self._make_sound(wave * env * 0.35)
 
     def _make_death(self) -> pygame.mixer.Sound:
         """NES Pac-Man death sound - descending arpeggio with square waves"""
-        samples = []
-        
         # NES death is a descending series of notes
         # Approximately 11 notes descending chromatically then spinning down
         notes = [
@@ -281,105 +410,71 @@ class AudioEngine:
             (311, 0.15),  # Eb4
             (294, 0.20),  # D4 - longer
         ]
-        
-        for freq, dur in notes:
-            n = int(SAMPLE_RATE * dur)
-            for i in range(n):
-                t = i / SAMPLE_RATE
-                progress = t / dur
-                
-                # 25% duty cycle square wave
-                phase = (t * freq) % 1.0
-                wave = 1.0 if phase < 0.25 else -1.0
-                
-                # Envelope with sustain then quick release
-                if progress < 0.8:
-                    env = 1.0
-                else:
-                    env = 1.0 - (progress - 0.8) / 0.2
-                
-                samples.append(wave * env * 0.35)
-        
+
+        # 25% duty cycle square wave, sustain then quick release
+        arpeggio = np.concatenate([_render_note(f, d, 0.25, "sustain_release") for f, d in notes])
+        segments = [arpeggio * 0.35]
+
         # Final spin-down
         spin_dur = 0.4
-        n = int(SAMPLE_RATE * spin_dur)
-        for i in range(n):
-            t = i / SAMPLE_RATE
-            progress = t / spin_dur
-            freq = 294 * (1.0 - progress * 0.7)  # Spin down from D4
-            
-            phase = (t * freq) % 1.0
-            wave = 1.0 if phase < 0.25 else -1.0
-            env = 1.0 - progress
-            
-            samples.append(wave * env * 0.3)
-        
-        return self._make_sound(samples)
+        t = self._time_axis(spin_dur)
+        progress = t * (1.0 / spin_dur)
+        freq = 294 * (1.0 - progress * 0.7)  # Spin down from D4
+
+        wave = self._square(freq, t.size, 0.25)
+        env = 1.0 - progress
+
+        segments.append(wave * env * 0.3)
+
+        return self._make_sound(np.concatenate(segments))
 
     def _make_eat_ghost(self) -> pygame.mixer.Sound:
         """NES eating ghost sound - rapid ascending notes"""
-        samples = []
-        
-        # Quick ascending arpeggio
+        # Quick ascending arpeggio, 12.5% duty square wave
         notes = [(330, 0.08), (440, 0.08), (554, 0.08), (659, 0.15)]
-        
-        for freq, dur in notes:
-            n = int(SAMPLE_RATE * dur)
-            for i in range(n):
-                t = i / SAMPLE_RATE
-                progress = t / dur
-                
-                # 12.5% duty square wave
-                phase = (t * freq) % 1.0
-                wave = 1.0 if phase < 0.125 else -1.0
-                
-                env = 1.0 - progress * 0.3
-                samples.append(wave * env * 0.35)
-        
-        return self._make_sound(samples)
+        samples = np.concatenate([_render_note(f, d, 0.125, "fade_30") for f, d in notes])
+        return self._make_sound(samples * 0.35)
+
+    def _make_sirens(self) -> List[pygame.mixer.Sound]:
+        """NES background sirens 1-4 - oscillating square wave, faster as dots decrease"""
+        # All four levels are rendered together as rows of one (4, n) array
+        levels = np.arange(1, 5)[:, None]
+        durations = [max(0.25, 0.6 - level * 0.08) for level in range(1, 5)]
+        base_freq = 80 + levels * 25
+        t = self._time_axis(max(durations))
+
+        # Oscillating pitch (siren effect)
+        osc = np.sin(2 * np.pi * (2 + levels) * t)
+        f = base_freq + 40 * osc
+
+        # 50% duty square wave for fuller sound
+        waves = self._square(f, t.size, 0.5)
+
+        return [self._make_sound(wave[:int(SAMPLE_RATE * dur)] * 0.12)
+                for wave, dur in zip(waves, durations)]
 
     def _make_siren(self, level: int) -> pygame.mixer.Sound:
-        """NES background siren - oscillating square wave, faster as dots decrease"""
-        samples = []
-        base_freq = 80 + level * 25
-        duration = 0.6 - level * 0.08
-        duration = max(0.25, duration)
-        n = int(SAMPLE_RATE * duration)
-        
-        for i in range(n):
-            t = i / SAMPLE_RATE
-            # Oscillating pitch (siren effect)
-            osc = math.sin(2 * math.pi * (2 + level) * t)
-            f = base_freq + 40 * osc
-            
-            # 50% duty square wave for fuller sound
-            phase = (t * f) % 1.0
-            wave = 1.0 if phase < 0.5 else -1.0
-            
-            samples.append(wave * 0.12)
-        
-        return self._make_sound(samples)
+        """One siren level; all four are rendered and cached together"""
+        for lvl, siren in enumerate(self._make_sirens(), start=1):
+            self.sounds.setdefault(f"siren{lvl}", siren)
+        return self.sounds[f"siren{level}"]
 
     def _make_frightened(self) -> pygame.mixer.Sound:
         """NES frightened mode background sound - warbling square wave"""
-        samples = []
-        n = int(SAMPLE_RATE * 0.35)
-        for i in range(n):
-            t = i / SAMPLE_RATE
-            # Fast warble between two frequencies
-            warble = 1.0 if (t * 12) % 1.0 < 0.5 else 0.0
-            f = 220 + warble * 80
-            
-            # 25% duty square wave
-            phase = (t * f) % 1.0
-            wave = 1.0 if phase < 0.25 else -1.0
-            
-            samples.append(wave * 0.18)
-        return self._make_sound(samples)
+        t = self._time_axis(0.35)
+
+        # Fast warble between two frequencies
+        warble = np.where(np.mod(t * 12, 1.0) < 0.5, 1.0, 0.0)
+        f = 220 + warble * 80
+
+        # 25% duty square wave
+        wave = self._square(f, t.size, 0.25)
+
+        return self._make_sound(wave * 0.18)
 
     def _make_intro(self) -> pygame.mixer.Sound:
         """NES game start jingle - authentic Pac-Man intro melody"""
-        samples = []
+        segments = []
         # Classic Pac-Man intro melody (simplified NES version)
         # B4, B5, F#5, D#5, B5, F#5 pattern
         notes = [
@@ -389,83 +484,50 @@ class AudioEngine:
             (622, 0.12), (523, 0.12), (415, 0.12), (349, 0.12),
             (523, 0.12), (415, 0.30),
         ]
-        
+
         for freq, dur in notes:
-            n = int(SAMPLE_RATE * dur)
-            for i in range(n):
-                t = i / SAMPLE_RATE
-                progress = t / dur
-                
-                if freq == 0:
-                    samples.append(0)
-                    continue
-                
-                # 25% duty square wave (NES pulse channel)
-                phase = (t * freq) % 1.0
-                wave = 1.0 if phase < 0.25 else -1.0
-                
-                # Add second voice (harmony) at 5th interval
-                phase2 = (t * freq * 1.5) % 1.0
-                wave2 = 1.0 if phase2 < 0.25 else -1.0
-                
-                # Envelope
-                if progress < 0.05:
-                    env = progress / 0.05
-                elif progress > 0.85:
-                    env = (1.0 - progress) / 0.15
-                else:
-                    env = 1.0
-                
-                samples.append((wave * 0.3 + wave2 * 0.15) * env)
-        
-        return self._make_sound(samples)
+            if freq == 0:
+                segments.append(np.zeros(int(SAMPLE_RATE * dur), dtype=np.float32))
+                continue
+
+            # 25% duty square wave (NES pulse channel) plus a second
+            # voice (harmony) at a 5th interval, sharing one envelope
+            lead = _render_note(freq, dur, 0.25, "attack_release")
+            harmony = _render_note(freq * 1.5, dur, 0.25, "attack_release")
+            segments.append(lead * 0.3 + harmony * 0.15)
+
+        return self._make_sound(np.concatenate(segments))
 
     def _make_extra_life(self) -> pygame.mixer.Sound:
         """NES extra life sound - happy ascending arpeggio"""
-        samples = []
+        # 12.5% duty for bright sound
         notes = [(523, 0.08), (659, 0.08), (784, 0.08), (1047, 0.15)]
-        
-        for freq, dur in notes:
-            n = int(SAMPLE_RATE * dur)
-            for i in range(n):
-                t = i / SAMPLE_RATE
-                progress = t / dur
-                
-                # 12.5% duty for bright sound
-                phase = (t * freq) % 1.0
-                wave = 1.0 if phase < 0.125 else -1.0
-                
-                env = 1.0 - progress * 0.2
-                samples.append(wave * env * 0.35)
-        
-        return self._make_sound(samples)
+        samples = np.concatenate([_render_note(f, d, 0.125, "fade_20") for f, d in notes])
+        return self._make_sound(samples * 0.35)
 
     def _make_fruit(self) -> pygame.mixer.Sound:
         """NES fruit eaten sound - quick chirp"""
-        samples = []
-        n = int(SAMPLE_RATE * 0.12)
-        for i in range(n):
-            t = i / SAMPLE_RATE
-            progress = t / 0.12
-            
-            # Quick ascending chirp
-            f = 800 + progress * 400
-            
-            # 12.5% duty
-            phase = (t * f) % 1.0
-            wave = 1.0 if phase < 0.125 else -1.0
-            
-            env = 1.0 - progress
-            samples.append(wave * env * 0.35)
-        
-        return self._make_sound(samples)
+        t = self._time_axis(0.12)
+        progress = t * (1 / 0.12)
+
+        # Quick ascending chirp
+        f = 800 + progress * 400
+
+        # 12.5% duty
+        wave = self._square(f, t.size, 0.125)
+
+        env = 1.0 - progress
+        return self._make_sound(wave * env * 0.35)
 
     def play(self, name: str, loops: int = 0):
-        if not self.enabled or name not in self.sounds:
+        if not self.enabled:
             return
-        self.sounds[name].play(loops=loops)
+        sound = self._sound(name)
+        if sound is not None:
+            sound.play(loops=loops)
 
     def stop(self, name: str):
+        # Sounds that were never made cannot be playing
         if not self.enabled or name not in self.sounds:
             return
         self.sounds[name].stop()
@@ -475,7 +537,7 @@ class AudioEngine:
             return
         name = "waka1" if self.waka_toggle else "waka2"
         self.waka_toggle = not self.waka_toggle
-        self.sounds[name].play()
+        self._sound(name).play()
 
     def update_siren(self, dots_remaining: int, total_dots: int):
         """Update siren based on remaining dots"""
@@ -513,7 +575,7 @@ class AudioEngine:
         # Reset state
         self.current_siren = None
         # Stop each individual sound to be extra sure
-        for sound in self.sounds.values():
+        for sound in list(self.sounds.values()):
             sound.stop()
 
 
@@ -536,52 +598,114 @@ class GameState(Enum):
     ROLL_CALL = auto()
     READY = auto()
     PLAYING = auto()
+    GHOST_EATEN_PAUSE = auto()
     DYING = auto()
     LEVEL_COMPLETE = auto()
     GAMEOVER = auto()
 
-@dataclass
-class Vec2:
-    x: float
-    y: float
+# Screens with no gameplay to simulate run at IDLE_FPS to cut wakeups
+IDLE_STATES = frozenset((GameState.MENU, GameState.HOW_TO_PLAY, GameState.CREDITS,
+                         GameState.READY, GameState.GAMEOVER))
+STATE_FPS = {state: IDLE_FPS if state in IDLE_STATES else FPS for state in GameState}
 
-    def __add__(self, o): return Vec2(self.x + o.x, self.y + o.y)
-    def __sub__(self, o): return Vec2(self.x - o.x, self.y - o.y)
-    def __mul__(self, k): return Vec2(self.x * k, self.y * k)
-    def __eq__(self, o): return abs(self.x - o.x) < 0.001 and abs(self.y - o.y) < 0.001
-    
-    def dist_sq(self, o):
-        dx = self.x - o.x
-        dy = self.y - o.y
-        return dx * dx + dy * dy
-    
-    def copy(self):
-        return Vec2(self.x, self.y)
-
-# Direction vectors
-DIRS = {
-    "LEFT": Vec2(-1, 0),
-    "RIGHT": Vec2(1, 0),
-    "UP": Vec2(0, -1),
-    "DOWN": Vec2(0, 1),
-    "STOP": Vec2(0, 0),
-}
+def dist_sq(ax: float, ay: float, bx: float, by: float) -> float:
+    """Squared distance between two points (no allocation, no sqrt)"""
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy
+
+# Directions are small ints indexing the tables below
+UP, RIGHT, DOWN, LEFT, STOP = range(5)
+
+# Direction vectors, split into dx / dy
+DIR_DX = (0, 1, 0, -1, 0)
+DIR_DY = (-1, 0, 1, 0, 0)
+
+# Pac-Man mouth direction in degrees (STOP faces right)
+DIR_ANGLE = (90, 0, 270, 180, 0)
 
 DIR_KEYS = {
-    pygame.K_a: "LEFT", pygame.K_LEFT: "LEFT",
-    pygame.K_d: "RIGHT", pygame.K_RIGHT: "RIGHT",
-    pygame.K_w: "UP", pygame.K_UP: "UP",
-    pygame.K_s: "DOWN", pygame.K_DOWN: "DOWN"
+    pygame.K_a: LEFT, pygame.K_LEFT: LEFT,
+    pygame.K_d: RIGHT, pygame.K_RIGHT: RIGHT,
+    pygame.K_w: UP, pygame.K_UP: UP,
+    pygame.K_s: DOWN, pygame.K_DOWN: DOWN
 }
 
+# Keys that start a game from the menu / leave the game over screen
+START_KEYS = frozenset((pygame.K_SPACE, pygame.K_RETURN))
+GAMEOVER_EXIT_KEYS = frozenset((pygame.K_SPACE, pygame.K_ESCAPE))
+
 # Reverse direction lookup
-REVERSE = {
-    "LEFT": "RIGHT",
-    "RIGHT": "LEFT",
-    "UP": "DOWN",
-    "DOWN": "UP",
-    "STOP": "STOP"
-}
+REVERSE = (DOWN, LEFT, UP, RIGHT, STOP)
+
+# Bit per direction in the Game.passable / Game.ghost_passable tile masks
+DIR_BIT = (1, 2, 4, 8, 0)
+
+# Tiles where ghosts may not turn up (arcade restriction)
+GHOST_NO_UP_TILES = ((12, 11), (15, 11), (12, 23), (15, 23))
+
+# Dedicated RNG for ghost AI (bound methods skip the global random.* lookup)
+_rng = random.Random()
+
+# Ghost personalities as ints, for the jitted targeting helper
+BLINKY, PINKY, INKY, CLYDE = range(4)
+GHOST_IDS = {"BLINKY": BLINKY, "PINKY": PINKY, "INKY": INKY, "CLYDE": CLYDE}
+
+
+@njit(cache=True)
+def _chase_target(ghost_id: int, px: float, py: float, pac_dir: int,
+                  blinky_x: float, blinky_y: float, has_blinky: bool,
+                  clyde_far: bool) -> Tuple[float, float]:
+    """CHASE-mode target for a ghost personality (arcade rules)"""
+    pdx = DIR_DX[pac_dir]
+    pdy = DIR_DY[pac_dir]
+    
+    if ghost_id == PINKY:
+        # Targets 4 tiles ahead of Pac-Man
+        # Original game had overflow bug making UP also shift left 4 tiles
+        tx = px + pdx * 4
+        if pac_dir == UP:
+            tx -= 4
+        return (tx, py + pdy * 4)
+    
+    if ghost_id == INKY and has_blinky:
+        # Vector from Blinky to 2 tiles ahead of Pac-Man, doubled
+        ahead_x = px + pdx * 2
+        ahead_y = py + pdy * 2
+        if pac_dir == UP:
+            ahead_x -= 2  # Overflow bug
+        return (2 * ahead_x - blinky_x, 2 * ahead_y - blinky_y)
+    
+    if ghost_id == CLYDE and not clyde_far:
+        # Within 8 tiles: scatter to his corner (Ghost.SCATTER_TARGETS)
+        return (0.0, 31.0)
+    
+    # Blinky (and the fallbacks) target Pac-Man directly
+    return (px, py)
+
+
+@njit(cache=True)
+def _choose_dir(mask: int, direction: int, force_reverse: bool,
+                center_x: float, center_y: float,
+                target_x: float, target_y: float) -> int:
+    """Direction from a tile's ghost_passable mask that gets closest to target"""
+    reverse_dir = REVERSE[direction]
+    best_dir = reverse_dir  # Dead end - must reverse
+    min_dist = 0.0
+    found = False
+    for d in (UP, LEFT, DOWN, RIGHT):  # Priority order
+        if d == reverse_dir and not force_reverse:
+            continue
+        if not mask & DIR_BIT[d]:
+            continue
+        dx = center_x + DIR_DX[d] - target_x
+        dy = center_y + DIR_DY[d] - target_y
+        dist = dx * dx + dy * dy
+        if not found or dist < min_dist:
+            min_dist = dist
+            best_dir = d
+            found = True
+    return best_dir
 
 # ---------------------------------------------------------------------------
 # ACTOR CLASSES
@@ -589,40 +713,48 @@ REVERSE = {
 
 class Actor:
     def __init__(self, col: float, row: float, color: tuple, base_speed: float = 0.1):
-        self.pos = Vec2(col, row)
-        self.dir = DIRS["STOP"]
-        self.dir_name = "STOP"
-        self.next_dir = DIRS["STOP"]
-        self.next_dir_name = "STOP"
+        self.pos_x = col
+        self.pos_y = row
+        self.dir = STOP
+        self.next_dir = STOP
         self.base_speed = base_speed
         self.speed = base_speed
         self.color = color
         self.radius = 0.45
-        self.start_pos = Vec2(col, row)
+        self.start_x = col
+        self.start_y = row
+        # Per-frame displacement (dir * speed), kept in sync by recompute_velocity
+        self.vx = 0.0
+        self.vy = 0.0
 
     @property
-    def col(self): return int(self.pos.x)
+    def col(self): return int(self.pos_x)
     
     @property
-    def row(self): return int(self.pos.y)
+    def row(self): return int(self.pos_y)
     
     @property
-    def tile_center(self): return Vec2(self.col + 0.5, self.row + 0.5)
+    def tile_center(self): return (self.col + 0.5, self.row + 0.5)
 
     def at_tile_center(self, tolerance: float = 0.03) -> bool:
-        return (abs(self.pos.x - (self.col + 0.5)) < tolerance and 
-                abs(self.pos.y - (self.row + 0.5)) < tolerance)
+        return (abs(self.pos_x - (self.col + 0.5)) < tolerance and 
+                abs(self.pos_y - (self.row + 0.5)) < tolerance)
 
     def snap_to_center(self):
-        self.pos.x = self.col + 0.5
-        self.pos.y = self.row + 0.5
+        self.pos_x = self.col + 0.5
+        self.pos_y = self.row + 0.5
+
+    def recompute_velocity(self):
+        """Refresh vx / vy; call whenever dir or speed changes"""
+        self.vx = DIR_DX[self.dir] * self.speed
+        self.vy = DIR_DY[self.dir] * self.speed
 
     def reset(self):
-        self.pos = self.start_pos.copy()
-        self.dir = DIRS["STOP"]
-        self.dir_name = "STOP"
-        self.next_dir = DIRS["STOP"]
-        self.next_dir_name = "STOP"
+        self.pos_x = self.start_x
+        self.pos_y = self.start_y
+        self.dir = STOP
+        self.next_dir = STOP
+        self.recompute_velocity()
 
 
 class Pacman(Actor):
@@ -636,46 +768,41 @@ class Pacman(Actor):
         self.power_timer = 0
         self.cornering_buffer = None  # For pre-turning
 
-    def set_direction(self, dir_name: str):
+    def set_direction(self, direction: int):
         """Queue a direction change"""
-        self.next_dir_name = dir_name
-        self.next_dir = DIRS[dir_name]
+        self.next_dir = direction
 
     def update(self, game: 'Game'):
         # Cornering: Pac-Man can pre-turn slightly before reaching tile center
         # This is authentic to the arcade and makes controls feel responsive
         
         # Try to execute queued turn
-        if self.next_dir_name != "STOP":
+        if self.next_dir != STOP:
             if self.at_tile_center(tolerance=0.08):
-                if game.can_move(self.col, self.row, self.next_dir_name):
+                if game.can_move(self.col, self.row, self.next_dir):
                     self.snap_to_center()
                     self.dir = self.next_dir
-                    self.dir_name = self.next_dir_name
-                    self.next_dir = DIRS["STOP"]
-                    self.next_dir_name = "STOP"
+                    self.next_dir = STOP
+                    self.recompute_velocity()
 
         # Check if we can continue in current direction
-        if self.dir_name != "STOP":
-            next_col = self.col + int(self.dir.x)
-            next_row = self.row + int(self.dir.y)
-            
+        if self.dir != STOP:
             if self.at_tile_center(tolerance=0.03):
-                if not game.can_move(self.col, self.row, self.dir_name):
+                if not game.can_move(self.col, self.row, self.dir):
                     self.snap_to_center()
-                    self.dir = DIRS["STOP"]
-                    self.dir_name = "STOP"
+                    self.dir = STOP
+                    self.recompute_velocity()
                     return
 
         # Apply movement
-        if self.dir_name != "STOP":
-            self.pos = self.pos + (self.dir * self.speed)
+        self.pos_x += self.vx
+        self.pos_y += self.vy
 
         # Tunnel wrap
-        if self.pos.x < 0:
-            self.pos.x = MAZE_COLS - 0.5
-        elif self.pos.x >= MAZE_COLS:
-            self.pos.x = 0.5
+        if self.pos_x < 0:
+            self.pos_x = MAZE_COLS - 0.5
+        elif self.pos_x >= MAZE_COLS:
+            self.pos_x = 0.5
 
         # Mouth animation
         self.mouth_angle += self.anim_speed * self.mouth_dir
@@ -690,39 +817,45 @@ class Pacman(Actor):
 class Ghost(Actor):
     # Scatter targets (arcade-accurate corners)
     SCATTER_TARGETS = {
-        "BLINKY": Vec2(25, -3),   # Top-right
-        "PINKY": Vec2(2, -3),     # Top-left
-        "INKY": Vec2(27, 31),     # Bottom-right
-        "CLYDE": Vec2(0, 31),     # Bottom-left
+        "BLINKY": (25, -3),   # Top-right
+        "PINKY": (2, -3),     # Top-left
+        "INKY": (27, 31),     # Bottom-right
+        "CLYDE": (0, 31),     # Bottom-left
     }
     
     # Home positions in ghost pen
     PEN_POSITIONS = {
-        "BLINKY": Vec2(13.5, 11.5),  # Above pen
-        "PINKY": Vec2(13.5, 14.5),
-        "INKY": Vec2(11.5, 14.5),
-        "CLYDE": Vec2(15.5, 14.5),
+        "BLINKY": (13.5, 11.5),  # Above pen
+        "PINKY": (13.5, 14.5),
+        "INKY": (11.5, 14.5),
+        "CLYDE": (15.5, 14.5),
     }
 
     def __init__(self, name: str, color: tuple):
-        pos = self.PEN_POSITIONS[name]
-        super().__init__(pos.x, pos.y, color, base_speed=0.09)
+        pen_x, pen_y = self.PEN_POSITIONS[name]
+        super().__init__(pen_x, pen_y, color, base_speed=0.09)
         self.name = name
+        self.ghost_id = GHOST_IDS[name]
+        self.release_dots = GHOST_RELEASE_DOTS.get(name, 0)
         self.mode = GhostMode.IN_PEN if name != "BLINKY" else GhostMode.SCATTER
         self.previous_mode = GhostMode.SCATTER
         self.frightened_timer = 0
         self.flash_timer = 0
         self.dot_counter = 0
         self.force_reverse = False
-        self.eaten_return_target = Vec2(13.5, 11.5)
+        self.eaten_return_target = (13.5, 11.5)
+        # Decisions are scheduled by frame count instead of polling
+        # at_tile_center; 0 means "decide on the next update"
+        self.frames_to_decision = 0
+        self.decision_speed = self.speed
         
         # Blinky starts outside pen
         if name == "BLINKY":
-            self.pos = Vec2(13.5, 11.5)
-            self.dir = DIRS["LEFT"]
-            self.dir_name = "LEFT"
+            self.pos_x, self.pos_y = 13.5, 11.5
+            self.dir = LEFT
 
-    def get_target(self, pacman: Pacman, blinky: Optional['Ghost'] = None) -> Vec2:
+    def get_target(self, pacman: Pacman, blinky: Optional['Ghost'] = None,
+                   game: Optional['Game'] = None) -> Tuple[float, float]:
         """Get target tile based on ghost personality and mode"""
         
         if self.mode == GhostMode.SCATTER:
@@ -731,86 +864,53 @@ class Ghost(Actor):
         if self.mode == GhostMode.EATEN:
             return self.eaten_return_target
         
-        if self.mode == GhostMode.FRIGHTENED:
-            # Random target (ghosts move randomly when frightened)
-            return Vec2(random.randint(0, MAZE_COLS-1), random.randint(0, MAZE_ROWS-1))
-        
+        # (FRIGHTENED never gets here: update() turns those ghosts at random)
         # CHASE mode - each ghost has unique targeting
-        if self.name == "BLINKY":
-            # Directly targets Pac-Man
-            return pacman.pos.copy()
-        
-        elif self.name == "PINKY":
-            # Targets 4 tiles ahead of Pac-Man
-            # Original game had overflow bug making UP also shift left 4 tiles
-            target = pacman.pos + (pacman.dir * 4)
-            if pacman.dir_name == "UP":
-                # Authentic overflow bug
-                target.x -= 4
-            return target
-        
-        elif self.name == "INKY":
-            # Complex: vector from Blinky to 2 tiles ahead of Pac-Man, doubled
-            if blinky is None:
-                return pacman.pos.copy()
-            
-            # Get position 2 tiles ahead of Pac-Man
-            ahead = pacman.pos + (pacman.dir * 2)
-            if pacman.dir_name == "UP":
-                ahead.x -= 2  # Overflow bug
-            
-            # Vector from Blinky to that point, doubled
-            vec = ahead - blinky.pos
-            return ahead + vec
-        
-        elif self.name == "CLYDE":
+        px, py = pacman.pos_x, pacman.pos_y
+        clyde_far = True
+        if self.ghost_id == CLYDE:
             # If > 8 tiles from Pac-Man: target Pac-Man
             # If <= 8 tiles: scatter to corner
-            dist_sq = self.pos.dist_sq(pacman.pos)
-            if dist_sq > 64:  # 8^2 = 64
-                return pacman.pos.copy()
+            # Measured along the maze when the game's distance table
+            # covers both tiles, straight-line otherwise
+            dist = game.maze_distance(self.col, self.row, pacman.col, pacman.row) if game else -1
+            if dist < 0:
+                clyde_far = dist_sq(self.pos_x, self.pos_y, px, py) > 64  # 8^2 = 64
             else:
-                return self.SCATTER_TARGETS["CLYDE"]
+                clyde_far = dist > 8
         
-        return pacman.pos.copy()
+        if blinky is None:
+            return _chase_target(self.ghost_id, px, py, pacman.dir, 0.0, 0.0, False, clyde_far)
+        return _chase_target(self.ghost_id, px, py, pacman.dir,
+                             blinky.pos_x, blinky.pos_y, True, clyde_far)
 
-    def choose_direction(self, game: 'Game', target: Vec2) -> str:
+    def choose_direction(self, game: 'Game', target: Optional[Tuple[float, float]]) -> int:
         """Choose best direction toward target (arcade AI)"""
-        
-        # Ghosts can't reverse direction (except when mode changes)
-        reverse_dir = REVERSE.get(self.dir_name, "STOP")
-        
-        # Get all valid moves
-        valid_dirs = []
-        for dir_name in ["UP", "LEFT", "DOWN", "RIGHT"]:  # Priority order
-            if dir_name == reverse_dir and not self.force_reverse:
-                continue
-            if game.can_move(self.col, self.row, dir_name, is_ghost=True):
-                valid_dirs.append(dir_name)
-        
+        mask = game.ghost_passable[self.row * MAZE_COLS + self.col]
+        force_reverse = self.force_reverse
         self.force_reverse = False
         
-        if not valid_dirs:
-            # Dead end - must reverse
-            return reverse_dir
-        
         if self.mode == GhostMode.FRIGHTENED:
-            # Random direction when frightened
-            return random.choice(valid_dirs)
-        
-        # Find direction that minimizes distance to target
-        best_dir = valid_dirs[0]
-        min_dist = float('inf')
-        
-        for dir_name in valid_dirs:
-            d = DIRS[dir_name]
-            next_pos = Vec2(self.col + 0.5 + d.x, self.row + 0.5 + d.y)
-            dist = next_pos.dist_sq(target)
-            if dist < min_dist:
-                min_dist = dist
-                best_dir = dir_name
-        
-        return best_dir
+            # Random direction when frightened (no target needed)
+            reverse_dir = REVERSE[self.dir]
+            valid_dirs = [d for d in (UP, LEFT, DOWN, RIGHT)
+                          if mask & DIR_BIT[d] and (d != reverse_dir or force_reverse)]
+            if not valid_dirs:
+                return reverse_dir
+            return _rng.choice(valid_dirs)
+        
+        return _choose_dir(mask, self.dir, force_reverse,
+                           self.col + 0.5, self.row + 0.5, target[0], target[1])
+
+    def schedule_decision(self):
+        """Count the moves left until the next tile center at the current speed"""
+        self.recompute_velocity()
+        self.decision_speed = self.speed
+        # Distance to the next center along the current heading
+        offset = ((self.pos_x - self.col - 0.5) * DIR_DX[self.dir] +
+                  (self.pos_y - self.row - 0.5) * DIR_DY[self.dir])
+        remaining = -offset if offset < 0 else 1.0 - offset
+        self.frames_to_decision = max(1, round(remaining / self.speed))
 
     def update(self, game: 'Game', pacman: Pacman, blinky: Optional['Ghost'] = None):
         """Update ghost position and AI"""
@@ -825,56 +925,66 @@ class Ghost(Actor):
         # Handle eaten ghost returning to pen
         if self.mode == GhostMode.EATEN:
             self.speed = self.base_speed * 2  # Fast return
-            if self.at_tile_center() and self.col == 13 and self.row == 11:
+            if self.frames_to_decision <= 0 and self.col == 13 and self.row == 11:
                 self.mode = GhostMode.LEAVING_PEN
-                self.pos = Vec2(13.5, 14.5)
+                self.pos_x, self.pos_y = 13.5, 14.5
         
         # Handle leaving pen
         if self.mode == GhostMode.LEAVING_PEN:
             target_y = 11.5
-            if abs(self.pos.y - target_y) < 0.1:
-                self.pos.y = target_y
+            if abs(self.pos_y - target_y) < 0.1:
+                self.pos_y = target_y
                 self.mode = self.previous_mode if self.previous_mode != GhostMode.FRIGHTENED else GhostMode.CHASE
-                self.dir = DIRS["LEFT"]
-                self.dir_name = "LEFT"
+                self.dir = LEFT
+                self.frames_to_decision = 0
             else:
-                self.pos.y -= 0.05
+                self.pos_y -= 0.05
             return
         
         # Handle in pen (bobbing)
         if self.mode == GhostMode.IN_PEN:
             # Bob up and down
-            center_y = self.PEN_POSITIONS[self.name].y
+            center_y = self.PEN_POSITIONS[self.name][1]
             if not hasattr(self, 'bob_dir'):
                 self.bob_dir = 1
-            self.pos.y += 0.03 * self.bob_dir
-            if abs(self.pos.y - center_y) > 0.3:
+            self.pos_y += 0.03 * self.bob_dir
+            if abs(self.pos_y - center_y) > 0.3:
                 self.bob_dir *= -1
             return
         
-        # Normal movement - make decisions at tile centers
-        if self.at_tile_center(tolerance=0.03):
+        # Normal movement - make decisions on the frame a tile center is
+        # reached; a speed change reschedules from the current position
+        if self.frames_to_decision <= 0:
             self.snap_to_center()
             
-            # Get target based on current mode
-            target = self.get_target(pacman, blinky)
+            # Get target based on current mode (frightened ghosts turn
+            # at random, so skip the target entirely)
+            if self.mode == GhostMode.FRIGHTENED:
+                target = None
+            else:
+                target = self.get_target(pacman, blinky, game)
             
             # Choose best direction
-            new_dir = self.choose_direction(game, target)
-            self.dir_name = new_dir
-            self.dir = DIRS[new_dir]
-        
-        # Apply movement
-        self.pos = self.pos + (self.dir * self.speed)
-        
-        # Tunnel wrap
-        if self.pos.x < 0:
-            self.pos.x = MAZE_COLS - 0.5
-        elif self.pos.x >= MAZE_COLS:
-            self.pos.x = 0.5
+            self.dir = self.choose_direction(game, target)
+            self.schedule_decision()
+        elif self.speed != self.decision_speed:
+            self.schedule_decision()
+        
+        # Apply movement (vx / vy were refreshed by schedule_decision)
+        self.frames_to_decision -= 1
+        self.pos_x += self.vx
+        self.pos_y += self.vy
+        
+        # Tunnel wrap (lands on a tile center, so decide there)
+        if self.pos_x < 0:
+            self.pos_x = MAZE_COLS - 0.5
+            self.frames_to_decision = 0
+        elif self.pos_x >= MAZE_COLS:
+            self.pos_x = 0.5
+            self.frames_to_decision = 0
         
         # Slow down in tunnel
-        if self.row == 14 and (self.pos.x < 6 or self.pos.x > 21):
+        if self.row == 14 and (self.pos_x < 6 or self.pos_x > 21):
             self.speed = self.base_speed * 0.5
 
     def enter_frightened(self, duration: int):
@@ -889,12 +999,112 @@ class Ghost(Actor):
 
     def reset(self):
         super().reset()
-        self.pos = self.PEN_POSITIONS[self.name].copy()
+        self.pos_x, self.pos_y = self.PEN_POSITIONS[self.name]
         self.mode = GhostMode.IN_PEN if self.name != "BLINKY" else GhostMode.SCATTER
+        self.frames_to_decision = 0
         if self.name == "BLINKY":
-            self.pos = Vec2(13.5, 11.5)
-            self.dir = DIRS["LEFT"]
-            self.dir_name = "LEFT"
+            self.pos_x, self.pos_y = 13.5, 11.5
+            self.dir = LEFT
+
+
+# ---------------------------------------------------------------------------
+# SPRITE CACHE - Pre-rendered actor frames
+# ---------------------------------------------------------------------------
+
+MOUTH_FRAMES = 8  # Discrete mouth openings, frame 0 = closed
+
+class SpriteCache:
+    """Pac-Man mouth frames and ghost frames rendered once, then blitted"""
+
+    def __init__(self, radius: int):
+        self.radius = radius
+        
+        # Pac-Man: one frame per (direction, mouth step), centered in a
+        # square big enough for the mouth wedge (radius + 2)
+        self.pac_half = radius + 2
+        self.pacman_frames: Dict[Tuple[int, int], pygame.Surface] = {}
+        for direction, base_angle in enumerate(DIR_ANGLE):
+            for step in range(MOUTH_FRAMES):
+                self.pacman_frames[(direction, step)] = self._render_pacman(base_angle, step)
+        
+        # Ghosts: body + eyes per (color, direction); color None is the
+        # eyes alone, drawn for ghosts heading back to the pen
+        self.ghost_frames: Dict[Tuple[Optional[tuple], int], pygame.Surface] = {}
+        for color in (RED, PINK, CYAN, ORANGE, BLUE_FRIGHTENED, WHITE, None):
+            for direction in range(len(DIR_DX)):
+                self.ghost_frames[(color, direction)] = self._render_ghost(color, direction)
+
+    def _render_pacman(self, base_angle: float, step: int) -> pygame.Surface:
+        """Render one Pac-Man frame with the mouth cut out as transparency"""
+        c = self.pac_half
+        surf = pygame.Surface((2 * c + 1, 2 * c + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surf, YELLOW, (c, c), self.radius)
+        if step > 0:
+            angle = 45 * step / (MOUTH_FRAMES - 1)
+            pts = [(c, c)]
+            for a in [base_angle + angle, base_angle - angle]:
+                rad = math.radians(a)
+                pts.append((c + math.cos(rad) * (self.radius + 2), c - math.sin(rad) * (self.radius + 2)))
+            pygame.draw.polygon(surf, (0, 0, 0, 0), pts)
+        return surf.convert_alpha()
+
+    def _render_ghost(self, color: Optional[tuple], direction: int) -> pygame.Surface:
+        """Render a ghost with its center at (radius, radius + 2)"""
+        r = self.radius
+        x, y = r, r + 2
+        surf = pygame.Surface((2 * r + 2, 2 * r + 4), pygame.SRCALPHA)
+        if color is not None:
+            self._draw_ghost_body(surf, x, y, color)
+        
+        # Eyes looking in the movement direction
+        eye_r = r // 3
+        off_x = r // 2
+        pygame.draw.circle(surf, WHITE, (x - off_x, y - 3), eye_r)
+        pygame.draw.circle(surf, WHITE, (x + off_x, y - 3), eye_r)
+        pupil_r = eye_r // 2
+        dx = DIR_DX[direction] * 3
+        dy = DIR_DY[direction] * 3
+        pygame.draw.circle(surf, WALL_BLUE, (x - off_x + dx, y - 3 + dy), pupil_r)
+        pygame.draw.circle(surf, WALL_BLUE, (x + off_x + dx, y - 3 + dy), pupil_r)
+        return surf.convert_alpha()
+
+    def _draw_ghost_body(self, surf: pygame.Surface, x: int, y: int, color: tuple):
+        """Draw the dome and wavy bottom centered at (x, y)"""
+        r = self.radius
+        pygame.draw.circle(surf, color, (x, y - 2), r)
+        pygame.draw.rect(surf, color, (x - r, y - 2, r * 2, r))
+        
+        # Wavy bottom
+        wave_pts = []
+        for i in range(5):
+            wx = x - r + i * (r * 2) // 4
+            wy = y + r - 4 + (4 if i % 2 else 0)
+            wave_pts.append((wx, wy))
+        wave_pts.append((x + r, y + r - 4))
+        wave_pts.append((x + r, y))
+        wave_pts.append((x - r, y))
+        pygame.draw.polygon(surf, color, wave_pts)
+
+    def pacman(self, direction: int, mouth_angle: float) -> pygame.Surface:
+        """Frame for a direction and mouth opening (0..1)"""
+        return self.pacman_frames[(direction, int(mouth_angle * (MOUTH_FRAMES - 1) + 0.5))]
+
+    def ghost(self, color: Optional[tuple], direction: int) -> pygame.Surface:
+        """Frame for a color and direction, rendered on first use if uncached"""
+        frame = self.ghost_frames.get((color, direction))
+        if frame is None:
+            frame = self.ghost_frames[(color, direction)] = self._render_ghost(color, direction)
+        return frame
+
+
+# Kill-screen noise source (batched draws, see Game.draw_maze)
+_glitch_rng = np.random.default_rng()
+
+
+@functools.lru_cache(maxsize=128)
+def _render_text(font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+    """Antialiased text surface, memoized so unchanged labels are only blitted"""
+    return font.render(text, True, color).convert_alpha()
 
 
 # ---------------------------------------------------------------------------
@@ -906,6 +1116,10 @@ class Game:
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("CAT'S PACMAN")
+        # Only quit and key presses are ever read; keep mouse motion and
+        # other high-rate events out of the queue entirely
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.clock = pygame.time.Clock()
         
         # Fonts
@@ -915,19 +1129,41 @@ class Game:
         # Audio
         self.audio = AudioEngine()
         
+        # Pre-rendered actor sprites (Pac-Man and ghosts share a radius)
+        self.sprites = SpriteCache(int(0.45 * TILE_SIZE * SCALE))
+        
+        # Translucent red wash for the game over screen, built once in the
+        # display's pixel format
+        self.red_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.red_overlay.set_alpha(100)
+        self.red_overlay.fill(RED)
+        
         # Game state
+        self.running = True  # Cleared to leave run() and shut down
         self.state = GameState.MENU
         self.level = 1
         self.score = 0
         self.high_score = 0
         self.lives = 3
         self.state_timer = 0
+        self.frame_count = 0  # Frames since start; drives menu animation and blinks
+        self.frame_step = 1  # FPS frames per tick (2 at IDLE_FPS)
         self.mode_timer = 0
         self.mode_phase = 0
         self.current_mode = GhostMode.SCATTER
         self.total_dots = 0
         self.dots_eaten_level = 0
         self.ghost_eat_combo = 0  # For scoring: 200, 400, 800, 1600
+        # (ghost, points) eaten this frame, each shown for its own pause
+        self.eaten_queue: List[Tuple[Ghost, int]] = []
+        # Screen areas a handler changed this frame; None presents the
+        # whole screen, an empty list presents nothing
+        self.dirty_rects: Optional[List[pygame.Rect]] = None
+        self.gameover_backdrop: Optional[pygame.Surface] = None
+        self.gameover_blinks: Tuple[Optional[int], Optional[bool]] = (None, None)
+        # Pre-rendered text screens, keyed by the state showing them
+        self.static_screens: Dict[GameState, pygame.Surface] = {}
+        self.static_prompt_on = 0
         
         # Create actors
         self.pacman = Pacman()
@@ -938,21 +1174,48 @@ class Game:
             Ghost("CLYDE", ORANGE),
         ]
         
-        # Initialize level
-        self.dots: List[Tuple[int, int]] = []
-        self.power_pellets: List[Tuple[int, int]] = []
+        # Initialize level: dots holds 1 for every uneaten dot or power
+        # pellet (POWER_TILES tells them apart)
+        self.dots = np.zeros((MAZE_ROWS, MAZE_COLS), dtype=np.uint8)
+        self.dots_remaining = 0
         self.fruit_active = False
         self.fruit_timer = 0
-        self.fruit_pos = (13, 17)
-        
-        self.reset_level()
+        self.fruit_col, self.fruit_row = 13, 17
         
-        # Precompute wall data for rendering
+        # Precompute wall data for rendering (reset_level bakes it into
+        # the maze surface)
         self._precompute_walls()
+        self._precompute_passable()
+        self._precompute_distances()
+        self.maze_surface: Optional[pygame.Surface] = None
+        self.maze_flash_surface: Optional[pygame.Surface] = None
+        self.dotted_maze_surface: Optional[pygame.Surface] = None
+        self.maze_surface_level = 0
+        # Screen strips above and below the maze (score and lives rows);
+        # the opaque maze blit covers everything in between
+        maze_bottom = 70 + MAZE_ROWS * TILE_SIZE * SCALE
+        self.ui_bands = (pygame.Rect(0, 0, SCREEN_WIDTH, 70),
+                         pygame.Rect(0, maze_bottom, SCREEN_WIDTH, SCREEN_HEIGHT - maze_bottom))
+        
+        # Per-frame handler for each state, looked up once per tick in run()
+        self.state_handlers: Dict[GameState, Callable[[List[pygame.event.Event]], None]] = {
+            GameState.MENU: self.run_menu,
+            GameState.HOW_TO_PLAY: self.run_how_to_play,
+            GameState.CREDITS: self.run_credits,
+            GameState.READY: self.run_ready,
+            GameState.PLAYING: self.run_game,
+            GameState.GHOST_EATEN_PAUSE: self.run_ghost_eaten_pause,
+            GameState.DYING: self.run_dying,
+            GameState.LEVEL_COMPLETE: self.run_level_complete,
+            GameState.GAMEOVER: self.run_gameover,
+        }
+        
+        self.reset_level()
 
     def _precompute_walls(self):
         """Precompute wall connectivity for nicer rendering"""
-        self.wall_data = {}
+        # Per wall tile, bits 0-3 flag a wall neighbor up/down/left/right
+        self.wall_nbits = np.zeros((MAZE_ROWS, MAZE_COLS), dtype=np.uint8)
         for r in range(MAZE_ROWS):
             for c in range(MAZE_COLS):
                 if MAZE_LAYOUT[r][c] == '#':
@@ -961,119 +1224,148 @@ class Game:
                     down = r < MAZE_ROWS-1 and MAZE_LAYOUT[r+1][c] == '#'
                     left = c > 0 and MAZE_LAYOUT[r][c-1] == '#'
                     right = c < MAZE_COLS-1 and MAZE_LAYOUT[r][c+1] == '#'
-                    self.wall_data[(c, r)] = (up, down, left, right)
+                    self.wall_nbits[r, c] = up | (down << 1) | (left << 2) | (right << 3)
+
+    def _precompute_passable(self):
+        """Precompute per-tile movement bitmasks (DIR_BIT) for can_move"""
+        self.passable = bytearray(MAZE_ROWS * MAZE_COLS)
+        self.ghost_passable = bytearray(MAZE_ROWS * MAZE_COLS)
+        for r in range(MAZE_ROWS):
+            for c in range(MAZE_COLS):
+                idx = r * MAZE_COLS + c
+                for d in (UP, RIGHT, DOWN, LEFT):
+                    nc = c + DIR_DX[d]
+                    nr = r + DIR_DY[d]
+                    if nc < 0 or nc >= MAZE_COLS:
+                        # Tunnel wrap
+                        pacman_ok = ghost_ok = True
+                    elif nr < 0 or nr >= MAZE_ROWS:
+                        pacman_ok = ghost_ok = False
+                    else:
+                        # Walls block everyone, the ghost gate only Pac-Man
+                        char = MAZE_LAYOUT[nr][nc]
+                        pacman_ok = char != '#' and char != '-'
+                        ghost_ok = char != '#'
+                    if d == UP and (c, r) in GHOST_NO_UP_TILES:
+                        ghost_ok = False
+                    if pacman_ok:
+                        self.passable[idx] |= DIR_BIT[d]
+                    if ghost_ok:
+                        self.ghost_passable[idx] |= DIR_BIT[d]
+
+    def _precompute_distances(self):
+        """BFS maze distances between every pair of tiles Pac-Man can reach"""
+        # Number the tiles reachable from Pac-Man's start
+        start = 23 * MAZE_COLS + 13
+        order = [start]
+        seen = {start}
+        for i in order:
+            r, c = divmod(i, MAZE_COLS)
+            for d in (UP, RIGHT, DOWN, LEFT):
+                if self.passable[i] & DIR_BIT[d]:
+                    j = (r + DIR_DY[d]) * MAZE_COLS + (c + DIR_DX[d]) % MAZE_COLS
+                    if j not in seen:
+                        seen.add(j)
+                        order.append(j)
+        self.tile_index = np.full(MAZE_ROWS * MAZE_COLS, -1, dtype=np.int16)
+        self.tile_index[order] = np.arange(len(order))
+        
+        neighbors = []
+        for i in order:
+            r, c = divmod(i, MAZE_COLS)
+            neighbors.append([
+                int(self.tile_index[(r + DIR_DY[d]) * MAZE_COLS + (c + DIR_DX[d]) % MAZE_COLS])
+                for d in (UP, RIGHT, DOWN, LEFT) if self.passable[i] & DIR_BIT[d]])
+        
+        # One BFS per source tile; the maze never changes, so this is
+        # shared by every level
+        n = len(order)
+        self.dist_table = np.empty((n, n), dtype=np.uint8)
+        for src in range(n):
+            dist = [255] * n
+            dist[src] = 0
+            queue = [src]
+            for u in queue:
+                du = dist[u] + 1
+                for v in neighbors[u]:
+                    if dist[v] == 255:
+                        dist[v] = min(du, 254)
+                        queue.append(v)
+            self.dist_table[src] = dist
+
+    def maze_distance(self, col_a: int, row_a: int, col_b: int, row_b: int) -> int:
+        """Walking distance in tiles between two tiles, or -1 if either is off the path"""
+        a = self.tile_index[row_a * MAZE_COLS + col_a]
+        b = self.tile_index[row_b * MAZE_COLS + col_b]
+        if a < 0 or b < 0:
+            return -1
+        return int(self.dist_table[a, b])
 
     def reset_level(self):
         """Reset for new level or after death"""
         self.pacman.reset()
-        self.pacman.pos = Vec2(13.5, 23.5)
+        self.pacman.pos_x, self.pacman.pos_y = 13.5, 23.5
         
         for ghost in self.ghosts:
             ghost.reset()
         
+        # Re-bake the static maze when the level changes
+        if self.maze_surface is None or self.maze_surface_level != self.level:
+            self._build_maze_surface()
+        
         # Reset dots
-        self.dots = []
-        self.power_pellets = []
-        for r, row in enumerate(MAZE_LAYOUT):
-            for c, char in enumerate(row):
-                if char == '.':
-                    self.dots.append((c, r))
-                elif char == 'o':
-                    self.power_pellets.append((c, r))
-        
-        self.total_dots = len(self.dots) + len(self.power_pellets)
+        self.dots[:] = DOT_TILES | POWER_TILES
+        self.dots_remaining = int(np.count_nonzero(self.dots))
+        self._build_dotted_maze()
+        
+        self.total_dots = self.dots_remaining
         self.dots_eaten_level = 0
         self.fruit_active = False
         self.ghost_eat_combo = 0
+        self.eaten_queue.clear()  # A pause cut short by ESC leaves entries
         
         # Reset mode timing
         self.mode_timer = 0
         self.mode_phase = 0
         self.current_mode = GhostMode.SCATTER
+        self._build_mode_schedule()
         
         # Set speeds based on level
         self._apply_level_speeds()
 
     def _apply_level_speeds(self):
         """Apply arcade-accurate speeds for current level"""
-        lvl = min(self.level, 21)  # Speed caps at level 21
+        pac_speed, ghost_speed = LEVEL_ACTOR_SPEEDS[self.level]
         
-        if lvl in SPEED_TABLE:
-            speeds = SPEED_TABLE[lvl]
-        else:
-            # Interpolate for missing levels
-            speeds = SPEED_TABLE[5]  # Use level 5+ speeds
-        
-        base = 0.1333  # Base speed unit (arcade timing)
-        self.pacman.speed = base * speeds[0]
+        self.pacman.speed = pac_speed
+        self.pacman.recompute_velocity()
         
         for ghost in self.ghosts:
-            ghost.base_speed = base * speeds[3]
+            ghost.base_speed = ghost_speed
             ghost.speed = ghost.base_speed
 
-    def can_move(self, col: int, row: int, dir_name: str, is_ghost: bool = False) -> bool:
+    def can_move(self, col: int, row: int, direction: int, is_ghost: bool = False) -> bool:
         """Check if movement in direction is valid"""
-        d = DIRS[dir_name]
-        nc = col + int(d.x)
-        nr = row + int(d.y)
-        
-        # Tunnel wrap
-        if nc < 0 or nc >= MAZE_COLS:
-            return True
-        
-        if nr < 0 or nr >= MAZE_ROWS:
-            return False
-        
-        char = MAZE_LAYOUT[nr][nc]
-        
-        # Ghosts can't go up in certain tiles (arcade restriction)
-        if is_ghost and dir_name == "UP":
-            if (col, row) in [(12, 11), (15, 11), (12, 23), (15, 23)]:
-                return False
-        
-        # Wall check
-        if char == '#':
-            return False
-        
-        # Ghost gate - only ghosts can pass
-        if char == '-':
-            return is_ghost
-        
-        return True
+        mask = self.ghost_passable if is_ghost else self.passable
+        return bool(mask[row * MAZE_COLS + col] & DIR_BIT[direction])
 
-    def get_mode_timing(self) -> List[Tuple[int, int]]:
-        """Get scatter/chase timing for current level"""
-        if self.level == 1:
-            return MODE_TIMING[1]
-        elif self.level < 5:
-            return MODE_TIMING[2]
-        else:
-            return MODE_TIMING[5]
+    def _build_mode_schedule(self):
+        """Look up the cached mode switch frames for the current level"""
+        self.mode_switch_frames = _mode_schedule(self.level)
 
     def update_ghost_mode(self, dt: float):
         """Update global ghost mode (scatter/chase cycle)"""
-        timings = self.get_mode_timing()
-        if self.mode_phase >= len(timings):
+        # mode_timer counts frames since the level started; mode_phase
+        # indexes the next switch (even phases scatter, odd phases chase)
+        if self.mode_phase >= len(self.mode_switch_frames):
             return
         
-        scatter_time, chase_time = timings[self.mode_phase]
-        
-        # Current mode duration
-        if self.current_mode == GhostMode.SCATTER:
-            target_time = scatter_time * FPS
-        else:
-            target_time = chase_time * FPS if chase_time > 0 else float('inf')
-        
         self.mode_timer += 1
         
-        if self.mode_timer >= target_time and chase_time != -1:
+        if self.mode_timer >= self.mode_switch_frames[self.mode_phase]:
             # Switch modes
-            self.mode_timer = 0
-            if self.current_mode == GhostMode.SCATTER:
-                self.current_mode = GhostMode.CHASE
-            else:
-                self.current_mode = GhostMode.SCATTER
-                self.mode_phase += 1
+            self.mode_phase += 1
+            self.current_mode = GhostMode.CHASE if self.mode_phase % 2 else GhostMode.SCATTER
             
             # Update all ghosts
             for ghost in self.ghosts:
@@ -1085,43 +1377,53 @@ class Game:
     def release_ghosts(self):
         """Release ghosts from pen based on dots eaten"""
         for ghost in self.ghosts:
-            if ghost.mode == GhostMode.IN_PEN:
-                release_count = GHOST_RELEASE_DOTS.get(ghost.name, 0)
-                if self.dots_eaten_level >= release_count:
-                    ghost.mode = GhostMode.LEAVING_PEN
+            if ghost.mode == GhostMode.IN_PEN and self.dots_eaten_level >= ghost.release_dots:
+                ghost.mode = GhostMode.LEAVING_PEN
 
     def handle_collisions(self):
         """Check for Pac-Man/Ghost collisions"""
+        # Collision check (arcade uses tile-based); the tile test rejects
+        # almost every ghost, so it runs before the mode checks
+        pac_col, pac_row = self.pacman.col, self.pacman.row
         for ghost in self.ghosts:
+            if int(ghost.pos_x) != pac_col or int(ghost.pos_y) != pac_row:
+                continue
             if ghost.mode in (GhostMode.IN_PEN, GhostMode.LEAVING_PEN):
                 continue
             
-            # Collision check (arcade uses tile-based)
-            if self.pacman.col == ghost.col and self.pacman.row == ghost.row:
-                if ghost.mode == GhostMode.FRIGHTENED:
-                    # Eat ghost
-                    ghost.mode = GhostMode.EATEN
-                    self.ghost_eat_combo += 1
-                    points = 200 * (2 ** (self.ghost_eat_combo - 1))
-                    self.score += points
-                    self.audio.play("eat_ghost")
-                    # Brief pause (arcade does this)
-                    pygame.time.delay(500)
-                elif ghost.mode != GhostMode.EATEN:
-                    # Pac-Man dies
-                    self.state = GameState.DYING
+            if ghost.mode == GhostMode.FRIGHTENED:
+                # Eat ghost
+                ghost.mode = GhostMode.EATEN
+                self.ghost_eat_combo += 1
+                points = 200 * (2 ** (self.ghost_eat_combo - 1))
+                self.score += points
+                self.audio.play("eat_ghost")
+                # Brief pause per ghost (arcade does this), run as its own
+                # state so rendering, input and audio keep going
+                if not self.eaten_queue:
+                    self.state = GameState.GHOST_EATEN_PAUSE
                     self.state_timer = 0
-                    self.audio.stop_siren()
-                    self.audio.play("death")
-                    return True
+                self.eaten_queue.append((ghost, points))
+            elif ghost.mode != GhostMode.EATEN:
+                # Pac-Man dies
+                self.eaten_queue.clear()
+                self.state = GameState.DYING
+                self.state_timer = 0
+                self.audio.stop_siren()
+                self.audio.play("death")
+                return True
         return False
 
     def eat_dot(self):
         """Handle dot eating"""
-        pos = (self.pacman.col, self.pacman.row)
+        col, row = self.pacman.col, self.pacman.row
+        if not self.dots[row, col]:
+            return
+        self.dots[row, col] = 0
+        self.dots_remaining -= 1
         
-        if pos in self.dots:
-            self.dots.remove(pos)
+        if not POWER_TILES[row, col]:
+            self._erase_dot(col, row)
             self.score += 10
             self.dots_eaten_level += 1
             self.pacman.dots_eaten += 1
@@ -1132,15 +1434,14 @@ class Game:
                 self.fruit_active = True
                 self.fruit_timer = FPS * 10  # 10 seconds
         
-        elif pos in self.power_pellets:
-            self.power_pellets.remove(pos)
+        else:
             self.score += 50
             self.dots_eaten_level += 1
             self.ghost_eat_combo = 0
             self.audio.play("power")
             
             # Frighten ghosts
-            fright_time = FRIGHT_TIME.get(self.level, 0)
+            fright_time = LEVEL_FRIGHT_TIME[self.level]
             if fright_time > 0:
                 for ghost in self.ghosts:
                     ghost.enter_frightened(fright_time * FPS)
@@ -1148,7 +1449,7 @@ class Game:
     def eat_fruit(self):
         """Check for fruit eating"""
         if self.fruit_active:
-            if self.pacman.col == self.fruit_pos[0] and self.pacman.row == self.fruit_pos[1]:
+            if self.pacman.col == self.fruit_col and self.pacman.row == self.fruit_row:
                 fruit_data = FRUIT_TABLE.get(min(self.level, 13), ("key", 5000))
                 self.score += fruit_data[1]
                 self.fruit_active = False
@@ -1156,58 +1457,90 @@ class Game:
 
     def check_level_complete(self):
         """Check if level is complete"""
-        if not self.dots and not self.power_pellets:
+        if self.dots_remaining == 0:
             self.state = GameState.LEVEL_COMPLETE
             self.state_timer = 0
             self.audio.stop_siren()
 
     # --- DRAWING ---
 
-    def draw_maze(self):
-        """Draw the maze with kill screen support"""
-        is_kill_screen = (self.level >= 256)
+    def _build_maze_surface(self):
+        """Pre-render the maze, plus its white-walled level-complete flash"""
+        self.maze_surface = self._render_maze(WALL_BLUE)
+        self.maze_flash_surface = self._render_maze(WHITE_FLASH)
+        self.maze_surface_level = self.level
+
+    def _render_maze(self, wall_color: tuple) -> pygame.Surface:
+        """Draw walls and the ghost gate into one maze-sized surface"""
+        ts = TILE_SIZE * SCALE
+        surface = pygame.Surface((MAZE_COLS * ts, MAZE_ROWS * ts)).convert()
+        surface.fill(BLACK)
+        # The kill screen's right half is redrawn as garbage every frame
+        cols = 14 if self.level >= 256 else MAZE_COLS
         
         for r in range(MAZE_ROWS):
-            for c in range(MAZE_COLS):
-                is_glitch = is_kill_screen and c >= 14
+            for c in range(cols):
+                x = c * ts
+                y = r * ts
+                char = MAZE_LAYOUT[r][c]
                 
-                x = c * TILE_SIZE * SCALE
-                y = r * TILE_SIZE * SCALE + 70  # Offset for UI
-                rect = (x, y, TILE_SIZE * SCALE, TILE_SIZE * SCALE)
+                # Draw walls
+                if char == '#':
+                    self._draw_wall_tile(surface, c, r, x, y, wall_color)
                 
-                if is_glitch:
-                    # Kill screen garbage
-                    if random.random() < 0.75:
-                        color = random.choice(GLITCH_COLORS)
-                        if random.random() < 0.5:
-                            pygame.draw.rect(self.screen, color, rect)
-                        else:
-                            char = random.choice(["█", "▓", "░", "▒", "◘", "○", "◙"])
-                            txt = self.font.render(char, True, color)
-                            self.screen.blit(txt, (x, y))
+                # Draw ghost gate
+                elif char == '-':
+                    gate_rect = (x, y + ts // 2 - 2, ts, 4)
+                    pygame.draw.rect(surface, PINK, gate_rect)
+        
+        return surface
+
+    def _build_dotted_maze(self):
+        """Copy the baked maze and draw every remaining dot onto it once"""
+        ts = TILE_SIZE * SCALE
+        self.dotted_maze_surface = self.maze_surface.copy()
+        for r, c in np.argwhere(self.dots & DOT_TILES).tolist():
+            if not (self.level >= 256 and c >= 14):
+                pygame.draw.circle(self.dotted_maze_surface, PELLET_COLOR,
+                                   (c * ts + ts // 2, r * ts + ts // 2), 3)
+
+    def _erase_dot(self, col: int, row: int):
+        """Black out an eaten dot (dot tiles hold no wall graphics)"""
+        ts = TILE_SIZE * SCALE
+        self.dotted_maze_surface.fill(BLACK, (col * ts, row * ts, ts, ts))
+
+    def clear_ui_bands(self):
+        """Black out the UI strips; stands in for a full clear before draw_maze"""
+        for band in self.ui_bands:
+            self.screen.fill(BLACK, band)
+
+    def draw_maze(self, flash: bool = False):
+        """Draw the maze with kill screen support (flash = white walls)"""
+        # Walls and uneaten dots come from one opaque pre-rendered surface
+        maze = self.maze_flash_surface if flash else self.dotted_maze_surface
+        self.screen.blit(maze, (0, 70))  # Offset for UI
+        
+        if self.level >= 256:
+            # Kill screen garbage: the frame's noise is drawn in one batch,
+            # then only the filled cells are visited
+            ts = TILE_SIZE * SCALE
+            rows, cols = np.nonzero(_glitch_rng.random((MAZE_ROWS, MAZE_COLS - 14)) < 0.75)
+            n = rows.size
+            as_rect = (_glitch_rng.random(n) < 0.5).tolist()
+            colors = _glitch_rng.integers(len(GLITCH_COLORS), size=n).tolist()
+            chars = _glitch_rng.integers(len(GLITCH_CHARS), size=n).tolist()
+            for r, c, is_rect, ci, ch in zip(rows.tolist(), cols.tolist(), as_rect, colors, chars):
+                x = (c + 14) * ts
+                y = r * ts + 70
+                color = GLITCH_COLORS[ci]
+                if is_rect:
+                    pygame.draw.rect(self.screen, color, (x, y, ts, ts))
                 else:
-                    char = MAZE_LAYOUT[r][c]
-                    
-                    # Draw walls
-                    if char == '#':
-                        self._draw_wall_tile(c, r, x, y)
-                    
-                    # Draw ghost gate
-                    elif char == '-':
-                        gate_rect = (x, y + TILE_SIZE * SCALE // 2 - 2, 
-                                    TILE_SIZE * SCALE, 4)
-                        pygame.draw.rect(self.screen, PINK, gate_rect)
-        
-        # Draw dots
-        for dc, dr in self.dots:
-            if not (self.level >= 256 and dc >= 14):
-                x = dc * TILE_SIZE * SCALE + TILE_SIZE * SCALE // 2
-                y = dr * TILE_SIZE * SCALE + 70 + TILE_SIZE * SCALE // 2
-                pygame.draw.circle(self.screen, PELLET_COLOR, (x, y), 3)
+                    self.screen.blit(_render_text(self.font, GLITCH_CHARS[ch], color), (x, y))
         
         # Draw power pellets (with blink)
         if (pygame.time.get_ticks() // 150) % 2 == 0:
-            for pc, pr in self.power_pellets:
+            for pr, pc in np.argwhere(self.dots & POWER_TILES).tolist():
                 if not (self.level >= 256 and pc >= 14):
                     x = pc * TILE_SIZE * SCALE + TILE_SIZE * SCALE // 2
                     y = pr * TILE_SIZE * SCALE + 70 + TILE_SIZE * SCALE // 2
@@ -1217,74 +1550,51 @@ class Game:
         if self.fruit_active:
             self._draw_fruit()
 
-    def _draw_wall_tile(self, c: int, r: int, x: int, y: int):
+    def _draw_wall_tile(self, surface: pygame.Surface, c: int, r: int, x: int, y: int,
+                        color: tuple = WALL_BLUE):
         """Draw a single wall tile with connections"""
         s = TILE_SIZE * SCALE
         
         # Simple approach: draw border lines based on neighbors
-        if (c, r) in self.wall_data:
-            up, down, left, right = self.wall_data[(c, r)]
+        if MAZE_LAYOUT[r][c] == '#':
+            bits = int(self.wall_nbits[r, c])
             
             # Draw rounded corner style
-            pygame.draw.rect(self.screen, WALL_BLUE, (x+1, y+1, s-2, s-2), 1)
+            pygame.draw.rect(surface, color, (x+1, y+1, s-2, s-2), 1)
             
             # Connect to neighbors
-            if not up:
-                pygame.draw.line(self.screen, WALL_BLUE, (x+1, y+1), (x+s-2, y+1), 1)
-            if not down:
-                pygame.draw.line(self.screen, WALL_BLUE, (x+1, y+s-2), (x+s-2, y+s-2), 1)
-            if not left:
-                pygame.draw.line(self.screen, WALL_BLUE, (x+1, y+1), (x+1, y+s-2), 1)
-            if not right:
-                pygame.draw.line(self.screen, WALL_BLUE, (x+s-2, y+1), (x+s-2, y+s-2), 1)
+            if not bits & 1:  # Up
+                pygame.draw.line(surface, color, (x+1, y+1), (x+s-2, y+1), 1)
+            if not bits & 2:  # Down
+                pygame.draw.line(surface, color, (x+1, y+s-2), (x+s-2, y+s-2), 1)
+            if not bits & 4:  # Left
+                pygame.draw.line(surface, color, (x+1, y+1), (x+1, y+s-2), 1)
+            if not bits & 8:  # Right
+                pygame.draw.line(surface, color, (x+s-2, y+1), (x+s-2, y+s-2), 1)
 
     def _draw_fruit(self):
         """Draw current level's fruit"""
         fruit_data = FRUIT_TABLE.get(min(self.level, 13), ("key", 5000))
-        fruit_colors = {
-            "cherry": RED,
-            "strawberry": RED,
-            "orange": ORANGE,
-            "apple": RED,
-            "melon": (0, 200, 0),
-            "galaxian": YELLOW,
-            "bell": YELLOW,
-            "key": CYAN,
-        }
-        color = fruit_colors.get(fruit_data[0], WHITE)
+        color = FRUIT_COLORS.get(fruit_data[0], WHITE)
         
-        x = self.fruit_pos[0] * TILE_SIZE * SCALE + TILE_SIZE * SCALE // 2
-        y = self.fruit_pos[1] * TILE_SIZE * SCALE + 70 + TILE_SIZE * SCALE // 2
+        x = self.fruit_col * TILE_SIZE * SCALE + TILE_SIZE * SCALE // 2
+        y = self.fruit_row * TILE_SIZE * SCALE + 70 + TILE_SIZE * SCALE // 2
         pygame.draw.circle(self.screen, color, (x, y), 10)
 
     def draw_pacman(self):
         """Draw Pac-Man with mouth animation"""
-        x = int(self.pacman.pos.x * TILE_SIZE * SCALE)
-        y = int(self.pacman.pos.y * TILE_SIZE * SCALE + 70)
-        r = int(self.pacman.radius * TILE_SIZE * SCALE)
-        
-        # Draw body
-        pygame.draw.circle(self.screen, YELLOW, (x, y), r)
+        x = int(self.pacman.pos_x * TILE_SIZE * SCALE)
+        y = int(self.pacman.pos_y * TILE_SIZE * SCALE + 70)
         
-        # Draw mouth
-        if self.pacman.mouth_angle > 0:
-            angle = 45 * self.pacman.mouth_angle
-            
-            # Direction to angle
-            dir_angles = {"RIGHT": 0, "LEFT": 180, "UP": 90, "DOWN": 270, "STOP": 0}
-            base_angle = dir_angles.get(self.pacman.dir_name, 0)
-            
-            # Create mouth wedge
-            pts = [(x, y)]
-            for a in [base_angle + angle, base_angle - angle]:
-                rad = math.radians(a)
-                pts.append((x + math.cos(rad) * (r + 2), y - math.sin(rad) * (r + 2)))
-            pygame.draw.polygon(self.screen, BLACK, pts)
+        # Blit the cached frame for this direction and mouth opening
+        frame = self.sprites.pacman(self.pacman.dir, self.pacman.mouth_angle)
+        half = self.sprites.pac_half
+        self.screen.blit(frame, (x - half, y - half))
 
     def draw_ghost(self, ghost: Ghost):
         """Draw a ghost with proper animation"""
-        x = int(ghost.pos.x * TILE_SIZE * SCALE)
-        y = int(ghost.pos.y * TILE_SIZE * SCALE + 70)
+        x = int(ghost.pos_x * TILE_SIZE * SCALE)
+        y = int(ghost.pos_y * TILE_SIZE * SCALE + 70)
         r = int(ghost.radius * TILE_SIZE * SCALE)
         
         # Determine color
@@ -1296,57 +1606,25 @@ class Game:
                 color = BLUE_FRIGHTENED
         elif ghost.mode == GhostMode.EATEN:
             # Only draw eyes when eaten
-            self._draw_ghost_eyes(x, y, r, ghost)
-            return
+            color = None
         else:
             color = ghost.color
         
-        # Draw body (dome + wavy bottom)
-        pygame.draw.circle(self.screen, color, (x, y - 2), r)
-        pygame.draw.rect(self.screen, color, (x - r, y - 2, r * 2, r))
-        
-        # Wavy bottom
-        wave_pts = []
-        for i in range(5):
-            wx = x - r + i * (r * 2) // 4
-            wy = y + r - 4 + (4 if i % 2 else 0)
-            wave_pts.append((wx, wy))
-        wave_pts.append((x + r, y + r - 4))
-        wave_pts.append((x + r, y))
-        wave_pts.append((x - r, y))
-        pygame.draw.polygon(self.screen, color, wave_pts)
-        
-        # Draw eyes
-        self._draw_ghost_eyes(x, y, r, ghost)
-
-    def _draw_ghost_eyes(self, x: int, y: int, r: int, ghost: Ghost):
-        """Draw ghost eyes looking in movement direction"""
-        eye_r = r // 3
-        off_x = r // 2
-        
-        # White of eyes
-        pygame.draw.circle(self.screen, WHITE, (x - off_x, y - 3), eye_r)
-        pygame.draw.circle(self.screen, WHITE, (x + off_x, y - 3), eye_r)
-        
-        # Pupils - look in direction of movement
-        pupil_r = eye_r // 2
-        dx = int(ghost.dir.x * 3)
-        dy = int(ghost.dir.y * 3)
-        pygame.draw.circle(self.screen, WALL_BLUE, (x - off_x + dx, y - 3 + dy), pupil_r)
-        pygame.draw.circle(self.screen, WALL_BLUE, (x + off_x + dx, y - 3 + dy), pupil_r)
+        # Body and eyes come pre-composited from the sprite cache
+        self.screen.blit(self.sprites.ghost(color, ghost.dir), (x - r, y - r - 2))
 
     def draw_ui(self):
         """Draw score, lives, level"""
         # Score
-        score_txt = self.font.render(f"SCORE: {self.score:08d}", True, WHITE)
+        score_txt = _render_text(self.font, f"SCORE: {self.score:08d}", WHITE)
         self.screen.blit(score_txt, (10, 10))
         
         # High score
-        hi_txt = self.font.render(f"HIGH: {self.high_score:08d}", True, WHITE)
+        hi_txt = _render_text(self.font, f"HIGH: {self.high_score:08d}", WHITE)
         self.screen.blit(hi_txt, (SCREEN_WIDTH // 2 - 80, 10))
         
         # Level
-        lvl_txt = self.font.render(f"LVL:{self.level}", True, YELLOW)
+        lvl_txt = _render_text(self.font, f"LVL:{self.level}", YELLOW)
         self.screen.blit(lvl_txt, (SCREEN_WIDTH - 100, 10))
         
         # Lives (bottom)
@@ -1357,28 +1635,68 @@ class Game:
         
         # Fruit display (bottom right)
         fruit_data = FRUIT_TABLE.get(min(self.level, 13), ("key", 5000))
-        fruit_txt = self.font.render(fruit_data[0].upper(), True, WHITE)
+        fruit_txt = _render_text(self.font, fruit_data[0].upper(), WHITE)
         self.screen.blit(fruit_txt, (SCREEN_WIDTH - 100, SCREEN_HEIGHT - 40))
 
-    def draw_text_centered(self, text: str, y: int, color=WHITE, font=None):
+    def draw_text_centered(self, text: str, y: int, color=WHITE, font=None) -> pygame.Rect:
         if font is None:
             font = self.font
-        surf = font.render(text, True, color)
+        surf = _render_text(font, text, color)
         rect = surf.get_rect(center=(SCREEN_WIDTH // 2, y))
         self.screen.blit(surf, rect)
+        return rect
 
     # --- STATE HANDLERS ---
 
-    def run_menu(self):
+    def _handle_escape(self, e: pygame.event.Event) -> bool:
+        """Return to the menu on ESC; True if the event was taken"""
+        if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
+            self.state = GameState.MENU
+            self.audio.stop_all()
+            return True
+        return False
+
+    def show_static_screen(self, draw: Callable[[], None], prompt_text: str, prompt_y: int):
+        """Show a text screen whose only change is a blinking prompt
+        
+        The rest of the screen is drawn once by draw() and kept; after the
+        entry frame only the prompt is repainted, when its blink flips.
+        """
+        backdrop = self.static_screens.get(self.state)
+        if backdrop is None:
+            self.screen.fill(BLACK)
+            draw()
+            backdrop = self.static_screens[self.state] = self.screen.copy()
+        
+        prompt_on = (self.frame_count // BLINK_FRAMES) & 1
+        if self.state_timer == 0:
+            self.state_timer = 1
+            self.screen.blit(backdrop, (0, 0))
+            last_prompt = None
+        else:
+            last_prompt = self.static_prompt_on
+            self.dirty_rects = []
+        
+        if prompt_on != last_prompt:
+            prompt = _render_text(self.font, prompt_text, WHITE)
+            rect = prompt.get_rect(center=(SCREEN_WIDTH // 2, prompt_y))
+            self.screen.blit(backdrop, rect, rect)
+            if prompt_on:
+                self.screen.blit(prompt, rect)
+            if last_prompt is not None:
+                self.dirty_rects.append(rect)
+        self.static_prompt_on = prompt_on
+
+    def run_menu(self, events: List[pygame.event.Event]):
         self.screen.fill(BLACK)
         
         self.draw_text_centered("CAT'S PACMAN", 60, YELLOW, self.big_font)
         
         # Animated characters
-        t = time.time()
+        blink = (self.frame_count // BLINK_FRAMES) & 1
         
-        # Pac-Man and ghost chase animation
-        px = int((t * 80) % (SCREEN_WIDTH + 100)) - 50
+        # Pac-Man and ghost chase animation (80 px per second)
+        px = self.frame_count * 80 // FPS % (SCREEN_WIDTH + 100) - 50
         pygame.draw.circle(self.screen, YELLOW, (px, 140), 12)
         pygame.draw.circle(self.screen, RED, (px - 35, 140), 12)
         pygame.draw.circle(self.screen, PINK, (px - 60, 140), 12)
@@ -1387,7 +1705,7 @@ class Game:
         
         # Menu options
         menu_y = 220
-        if int(t * 2) % 2:
+        if blink:
             self.draw_text_centered("> PRESS SPACE TO START <", menu_y, WHITE)
         else:
             self.draw_text_centered("  PRESS SPACE TO START  ", menu_y, WHITE)
@@ -1405,11 +1723,9 @@ class Game:
         
         self.draw_text_centered("F1: SKIP LEVEL (DEBUG)", 600, (60, 60, 60))
         
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                sys.exit()
+        for e in events:
             if e.type == pygame.KEYDOWN:
-                if e.key in (pygame.K_SPACE, pygame.K_RETURN):
+                if e.key in START_KEYS:
                     self.state = GameState.READY
                     self.state_timer = 0
                     self.level = 1
@@ -1419,13 +1735,21 @@ class Game:
                     self.audio.play("intro")
                 elif e.key == pygame.K_h:
                     self.state = GameState.HOW_TO_PLAY
+                    self.state_timer = 0
                 elif e.key == pygame.K_c:
                     self.state = GameState.CREDITS
+                    self.state_timer = 0
 
-    def run_how_to_play(self):
+    def run_how_to_play(self, events: List[pygame.event.Event]):
         """How to Play screen"""
-        self.screen.fill(BLACK)
+        self.show_static_screen(self._draw_how_to_play, "PRESS ANY KEY TO RETURN", SCREEN_HEIGHT - 50)
         
+        for e in events:
+            if e.type == pygame.KEYDOWN:
+                self.state = GameState.MENU
+
+    def _draw_how_to_play(self):
+        """Draw the static part of the How to Play screen"""
         self.draw_text_centered("HOW TO PLAY", 50, YELLOW, self.big_font)
         
         y = 120
@@ -1467,25 +1791,20 @@ class Game:
         y += 10
         for color, name, desc in ghost_info:
             pygame.draw.circle(self.screen, color, (SCREEN_WIDTH // 2 - 140, y), 8)
-            txt = self.font.render(f"{name}: {desc}", True, color)
+            txt = _render_text(self.font, f"{name}: {desc}", color)
             self.screen.blit(txt, (SCREEN_WIDTH // 2 - 120, y - 10))
             y += 28
+
+    def run_credits(self, events: List[pygame.event.Event]):
+        """Credits screen"""
+        self.show_static_screen(self._draw_credits, "PRESS ANY KEY TO RETURN", SCREEN_HEIGHT - 40)
         
-        # Footer
-        t = time.time()
-        if int(t * 2) % 2:
-            self.draw_text_centered("PRESS ANY KEY TO RETURN", SCREEN_HEIGHT - 50, WHITE)
-        
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                sys.exit()
+        for e in events:
             if e.type == pygame.KEYDOWN:
                 self.state = GameState.MENU
 
-    def run_credits(self):
-        """Credits screen"""
-        self.screen.fill(BLACK)
-        
+    def _draw_credits(self):
+        """Draw the static part of the Credits screen"""
         self.draw_text_centered("CREDITS", 40, YELLOW, self.big_font)
         
         y = 110
@@ -1530,22 +1849,12 @@ class Game:
             y += 18
         
         # Scrolling thank you
-        t = time.time()
         scroll_y = SCREEN_HEIGHT - 80
         self.draw_text_centered("=^.^= THANK YOU FOR PLAYING! =^.^=", scroll_y, YELLOW)
-        
-        if int(t * 2) % 2:
-            self.draw_text_centered("PRESS ANY KEY TO RETURN", SCREEN_HEIGHT - 40, WHITE)
-        
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                sys.exit()
-            if e.type == pygame.KEYDOWN:
-                self.state = GameState.MENU
 
-    def run_ready(self):
+    def run_ready(self, events: List[pygame.event.Event]):
         """READY! screen before level starts"""
-        self.screen.fill(BLACK)
+        self.clear_ui_bands()
         self.draw_maze()
         self.draw_pacman()
         for ghost in self.ghosts:
@@ -1554,37 +1863,30 @@ class Game:
         
         self.draw_text_centered("READY!", SCREEN_HEIGHT // 2, YELLOW, self.big_font)
         
-        self.state_timer += 1
+        self.state_timer += self.frame_step
         if self.state_timer > FPS * 2:  # 2 seconds
             self.state = GameState.PLAYING
-            self.audio.update_siren(len(self.dots) + len(self.power_pellets), self.total_dots)
+            self.audio.update_siren(self.dots_remaining, self.total_dots)
         
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                sys.exit()
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_ESCAPE:
-                    self.state = GameState.MENU
-                    self.audio.stop_all()
-                    return
+        for e in events:
+            if self._handle_escape(e):
+                return
 
-    def run_game(self):
+    def run_game(self, events: List[pygame.event.Event]):
         """Main gameplay"""
         # Input
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                sys.exit()
+        for e in events:
+            if self._handle_escape(e):
+                return  # Stop processing this frame
             if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_ESCAPE:
-                    self.state = GameState.MENU
-                    self.audio.stop_all()
-                    return  # Stop processing this frame
-                if e.key in DIR_KEYS:
-                    self.pacman.set_direction(DIR_KEYS[e.key])
+                direction = DIR_KEYS.get(e.key)
+                if direction is not None:
+                    self.pacman.set_direction(direction)
                 # Debug: skip level
                 if e.key == pygame.K_F1:
-                    self.dots.clear()
-                    self.power_pellets.clear()
+                    self.dots[:] = 0
+                    self.dots_remaining = 0
+                    self._build_dotted_maze()
         
         # Update ghost mode timing
         self.update_ghost_mode(1)
@@ -1615,7 +1917,7 @@ class Game:
                 self.fruit_active = False
         
         # Update siren
-        self.audio.update_siren(len(self.dots) + len(self.power_pellets), self.total_dots)
+        self.audio.update_siren(self.dots_remaining, self.total_dots)
         
         # Check level complete
         self.check_level_complete()
@@ -1625,24 +1927,52 @@ class Game:
             self.high_score = self.score
         
         # Draw
-        self.screen.fill(BLACK)
+        self.clear_ui_bands()
         self.draw_maze()
         self.draw_pacman()
         for ghost in self.ghosts:
             self.draw_ghost(ghost)
         self.draw_ui()
 
-    def run_dying(self):
+    def run_ghost_eaten_pause(self, events: List[pygame.event.Event]):
+        """Freeze play for half a second, showing the points for the eaten ghost"""
+        self.clear_ui_bands()
+        self.draw_maze()
+        self.draw_pacman()
+        eaten, points = self.eaten_queue[0]
+        for ghost in self.ghosts:
+            if ghost is not eaten:
+                self.draw_ghost(ghost)
+        self.draw_ui()
+        
+        x = int(eaten.pos_x * TILE_SIZE * SCALE)
+        y = int(eaten.pos_y * TILE_SIZE * SCALE + 70)
+        txt = _render_text(self.font, str(points), CYAN)
+        self.screen.blit(txt, txt.get_rect(center=(x, y)))
+        
+        self.state_timer += 1
+        if self.state_timer >= FPS // 2:
+            # Next ghost eaten on the same frame gets its own pause
+            self.eaten_queue.pop(0)
+            if not self.eaten_queue:
+                self.state = GameState.PLAYING
+            self.state_timer = 0
+        
+        for e in events:
+            if self._handle_escape(e):
+                return
+
+    def run_dying(self, events: List[pygame.event.Event]):
         """Pac-Man death animation"""
-        self.screen.fill(BLACK)
+        self.clear_ui_bands()
         self.draw_maze()
         
         # Death animation - shrinking Pac-Man
         self.state_timer += 1
         progress = min(1.0, self.state_timer / (FPS * 1.5))
         
-        x = int(self.pacman.pos.x * TILE_SIZE * SCALE)
-        y = int(self.pacman.pos.y * TILE_SIZE * SCALE + 70)
+        x = int(self.pacman.pos_x * TILE_SIZE * SCALE)
+        y = int(self.pacman.pos_y * TILE_SIZE * SCALE + 70)
         r = int(self.pacman.radius * TILE_SIZE * SCALE * (1 - progress))
         
         if r > 0:
@@ -1657,126 +1987,163 @@ class Game:
                 self.state_timer = 0
             else:
                 self.pacman.reset()
-                self.pacman.pos = Vec2(13.5, 23.5)
+                self.pacman.pos_x, self.pacman.pos_y = 13.5, 23.5
                 for ghost in self.ghosts:
                     ghost.reset()
                 self.state = GameState.READY
                 self.state_timer = 0
         
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                sys.exit()
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_ESCAPE:
-                    self.state = GameState.MENU
-                    self.audio.stop_all()
-                    return
+        for e in events:
+            if self._handle_escape(e):
+                return
 
-    def run_level_complete(self):
+    def run_level_complete(self, events: List[pygame.event.Event]):
         """Level complete - flash maze"""
-        self.screen.fill(BLACK)
+        self.clear_ui_bands()
         
-        # Flash maze blue/white
+        # Flash maze blue/white (both versions are pre-rendered)
         self.state_timer += 1
         flash = (self.state_timer // 10) % 2
         
-        # Override wall color for flash
-        old_blue = WALL_BLUE
-        if flash:
-            # Temporarily change wall color
-            pass  # We'll just redraw with different color
-        
-        self.draw_maze()
+        self.draw_maze(flash=bool(flash))
         self.draw_pacman()
         self.draw_ui()
         
         if self.state_timer > FPS * 2:
             self.level += 1
-            if self.level > 256:
-                self.level = 256  # Cap at kill screen
+            if self.level > MAX_LEVEL:
+                self.level = MAX_LEVEL  # Cap at kill screen
             self.reset_level()
             self.state = GameState.READY
             self.state_timer = 0
         
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                sys.exit()
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_ESCAPE:
-                    self.state = GameState.MENU
-                    self.audio.stop_all()
-                    return
-
-    def run_gameover(self):
+        for e in events:
+            if self._handle_escape(e):
+                return
+
+    def _redraw_gameover_pellets(self, visible: bool) -> List[pygame.Rect]:
+        """Redraw the power pellet tiles under the red overlay"""
+        ts = TILE_SIZE * SCALE
+        rects = []
+        for pr, pc in np.argwhere(self.dots & POWER_TILES).tolist():
+            rect = pygame.Rect(pc * ts, pr * ts + 70, ts, ts)
+            self.screen.blit(self.dotted_maze_surface, rect, rect.move(0, -70))
+            if visible:
+                pygame.draw.circle(self.screen, PELLET_COLOR, rect.center, 7)
+            self.screen.blit(self.red_overlay, rect, rect)
+            rects.append(rect)
+        return rects
+
+    def run_gameover(self, events: List[pygame.event.Event]):
         """Game over screen"""
-        self.screen.fill(BLACK)
-        self.draw_maze()
-        self.draw_ui()
-        
-        # Red overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(100)
-        overlay.fill(RED)
-        self.screen.blit(overlay, (0, 0))
-        
-        self.draw_text_centered("GAME OVER", SCREEN_HEIGHT // 2 - 40, YELLOW, self.big_font)
-        self.draw_text_centered(f"FINAL SCORE: {self.score}", SCREEN_HEIGHT // 2 + 20, WHITE)
-        self.draw_text_centered(f"REACHED LEVEL {self.level}", SCREEN_HEIGHT // 2 + 60, WHITE)
-        
-        if int(time.time() * 2) % 2:
-            self.draw_text_centered("PRESS SPACE", SCREEN_HEIGHT // 2 + 120, WHITE)
-        
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                sys.exit()
-            if e.type == pygame.KEYDOWN:
-                if e.key in (pygame.K_SPACE, pygame.K_ESCAPE):
-                    self.state = GameState.MENU
-                    self.audio.stop_all()
+        # The screen is static apart from the prompt and power pellet
+        # blinks: compose it once, then redraw and present only the areas
+        # whose blink phase flipped, so most frames present nothing. Kill
+        # screen noise changes every frame, so it redraws everything.
+        prompt_on = (self.frame_count // BLINK_FRAMES) & 1
+        pellets_on = (pygame.time.get_ticks() // 150) % 2 == 0
+        full_redraw = self.state_timer == 0 or self.level >= 256
+        if full_redraw:
+            self.state_timer = 1
+            self.clear_ui_bands()
+            self.draw_maze()
+            self.draw_ui()
+            
+            # Red overlay
+            self.screen.blit(self.red_overlay, (0, 0))
+            
+            self.draw_text_centered("GAME OVER", SCREEN_HEIGHT // 2 - 40, YELLOW, self.big_font)
+            self.draw_text_centered(f"FINAL SCORE: {self.score}", SCREEN_HEIGHT // 2 + 20, WHITE)
+            self.draw_text_centered(f"REACHED LEVEL {self.level}", SCREEN_HEIGHT // 2 + 60, WHITE)
+            self.gameover_backdrop = self.screen.copy()
+            # draw_maze sampled the pellet blink itself; repaint the
+            # pellets next frame rather than trust it matches pellets_on
+            last_prompt, last_pellets = None, None
+        else:
+            last_prompt, last_pellets = self.gameover_blinks
+            self.dirty_rects = []
+            if pellets_on != last_pellets:
+                self.dirty_rects += self._redraw_gameover_pellets(pellets_on)
+        
+        if prompt_on != last_prompt:
+            prompt = _render_text(self.font, "PRESS SPACE", WHITE)
+            prompt_rect = prompt.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120))
+            self.screen.blit(self.gameover_backdrop, prompt_rect, prompt_rect)
+            if prompt_on:
+                self.screen.blit(prompt, prompt_rect)
+            if not full_redraw:
+                self.dirty_rects.append(prompt_rect)
+        self.gameover_blinks = (prompt_on, None if full_redraw else pellets_on)
+        
+        for e in events:
+            if e.type == pygame.KEYDOWN and e.key in GAMEOVER_EXIT_KEYS:
+                self.state = GameState.MENU
+                self.audio.stop_all()
 
     def run(self):
         """Main game loop"""
-        while True:
-            self.clock.tick(FPS)
+        # Bind the per-frame callables once instead of re-resolving them
+        # every iteration
+        tick = self.clock.tick
+        get_events = pygame.event.get
+        flip = pygame.display.flip
+        update = pygame.display.update
+        handlers = self.state_handlers
+        
+        while self.running:
+            # tick() sleeps rather than busy-waits; frame counters step in
+            # FPS units at the idle rate so timings are unchanged
+            fps = STATE_FPS[self.state]
+            tick(fps)
+            self.frame_step = FPS // fps
+            self.frame_count += self.frame_step
+            
+            # Drain the queue once per frame; every state honors quit here
+            # and gets the remaining key presses passed in
+            events = get_events()
+            if any(e.type == pygame.QUIT for e in events):
+                self.running = False
+                break
             
-            if self.state == GameState.MENU:
-                self.run_menu()
-            elif self.state == GameState.HOW_TO_PLAY:
-                self.run_how_to_play()
-            elif self.state == GameState.CREDITS:
-                self.run_credits()
-            elif self.state == GameState.READY:
-                self.run_ready()
-            elif self.state == GameState.PLAYING:
-                self.run_game()
-            elif self.state == GameState.DYING:
-                self.run_dying()
-            elif self.state == GameState.LEVEL_COMPLETE:
-                self.run_level_complete()
-            elif self.state == GameState.GAMEOVER:
-                self.run_gameover()
+            self.dirty_rects = None
+            handler = handlers.get(self.state)
+            if handler is not None:
+                handler(events)
             
-            pygame.display.flip()
+            if self.dirty_rects is None:
+                flip()
+            elif self.dirty_rects:
+                update(self.dirty_rects)
+        
+        # Leave the loop normally so audio stops before pygame shuts down
+        self.audio.stop_all()
+        pygame.quit()
 
 
 # ---------------------------------------------------------------------------
 # ENTRY POINT
 # ---------------------------------------------------------------------------
 
+BANNER = "\n".join((
+    "=" * 40,
+    "       CAT'S PACMAN",
+    "=" * 40,
+    "",
+    "(C) 1980 NAMCO LTD.",
+    "(C) 1999-2026 SAMSOFT / Team Flames",
+    "Licensed by Nintendo",
+    "HAL Laboratory, Inc.",
+    "",
+    "Controls: WASD or Arrow Keys",
+    "H: How to Play | C: Credits",
+    "F1: Skip level (debug)",
+    "",
+    "=^.^= meow ~",
+    "",
+    "",
+))
+
 if __name__ == "__main__":
-    print("=" * 40)
-    print("       CAT'S PACMAN")
-    print("=" * 40)
-    print()
-    print("(C) 1980 NAMCO LTD.")
-    print("(C) 1999-2026 SAMSOFT / Team Flames")
-    print("Licensed by Nintendo")
-    print("HAL Laboratory, Inc.")
-    print()
-    print("Controls: WASD or Arrow Keys")
-    print("H: How to Play | C: Credits")
-    print("F1: Skip level (debug)")
-    print()
-    print("=^.^= meow ~")
-    print()
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
     Game().run()
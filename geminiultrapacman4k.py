@@ -1,13 +1,26 @@
 import pygame
 import sys
+import time
 import math
 import random
-import array
+import bisect
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the jitted kernels run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
 
 # ---------------------------------------------------------------------------
 # CONSTANTS & CONFIGURATION
 # ---------------------------------------------------------------------------
-FPS = 60
+FPS = 60  # Game logic runs at this fixed rate regardless of render speed
+MAX_FRAME_TIME = 0.25  # Seconds of lag caught up at most, so a stall can't snowball
+SPIN_TIME = 0.002  # Tail of each frame spent busy-waiting for precise pacing (sleep covers the rest)
 TILE_SIZE = 8
 SCALE = 3  # Scale factor for modern screens (24px tiles)
 SCREEN_WIDTH = 28 * TILE_SIZE * SCALE
@@ -26,6 +39,12 @@ COLOR_CLYDE = (255, 184, 82)
 COLOR_FRIGHTENED = (33, 33, 255) # Blue/White flashing
 COLOR_RED = (255, 0, 0)
 COLOR_YELLOW = (255, 255, 0)
+FRUIT_COLORS = ((255,0,0), (255,180,180), (255,165,0), (255,0,0), (0,255,0), (255,255,0), (200,0,200), (255,255,255))
+
+# Animation wave (power pellet pulse, ghost feet) is sampled in this many steps per cycle
+WAVE_STEPS = 64
+# Ghost feet wave is drawn in this many phase steps per cycle (sprite cache size)
+GHOST_FOOT_PHASES = 8
 
 # Audio Config
 SAMPLE_RATE = 44100
@@ -68,46 +87,108 @@ MAZE_LAYOUT = [
     "                            "
 ]
 MAZE_LAYOUT = MAZE_LAYOUT[:31]
+MAZE_ROWS = len(MAZE_LAYOUT)
+MAZE_COLS = 28
+
+# Tilemap bitflags: the whole maze packs into one byte per tile
+WALL_BIT = 1
+PELLET_BIT = 2
+POWER_BIT = 4
+GATE_BIT = 8  # Ghost house door: only eaten/exiting ghosts pass
+GATE_TILES = [(13, 12), (14, 12)]
+
+def build_tilemap():
+    tilemap = np.zeros((MAZE_ROWS, MAZE_COLS), np.uint8)
+    for y, row in enumerate(MAZE_LAYOUT):
+        for x, char in enumerate(row):
+            if char == '#': tilemap[y, x] = WALL_BIT
+            elif char == '.': tilemap[y, x] = PELLET_BIT
+            elif char == 'o': tilemap[y, x] = POWER_BIT
+    for x, y in GATE_TILES:
+        tilemap[y, x] |= GATE_BIT
+    return tilemap
+
+MAZE_TILEMAP = build_tilemap()
+
+def tile_rect(tx, ty):
+    return pygame.Rect(tx * TILE_SIZE * SCALE, ty * TILE_SIZE * SCALE, TILE_SIZE * SCALE, TILE_SIZE * SCALE)
+
+def tile_at(tilemap, tx, ty):
+    """Bitflags of a tile; anything off the map (the tunnel) is open floor"""
+    if 0 <= tx < MAZE_COLS and 0 <= ty < MAZE_ROWS:
+        return tilemap.item(ty, tx)
+    return 0
 
 # ---------------------------------------------------------------------------
 # UTILITIES
 # ---------------------------------------------------------------------------
 
-class Vec2:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+@njit(cache=True)
+def step_actor(x, y, dx, dy, speed, tilemap, force):
+    """One frame of movement: half-tile look-ahead against the tilemap, move if
+    clear (or forced through the gate), then tunnel wrap. Returns (x, y, moved)."""
+    tx, ty = int(x + dx * 0.5), int(y + dy * 0.5)
+    blocked = False
+    if 0 <= tx < MAZE_COLS and 0 <= ty < MAZE_ROWS:
+        blocked = (tilemap[ty, tx] & (WALL_BIT | GATE_BIT)) != 0
     
-    def __add__(self, other):
-        return Vec2(self.x + other.x, self.y + other.y)
+    moved = force or not blocked
+    if moved:
+        x += dx * speed
+        y += dy * speed
     
-    def __sub__(self, other):
-        return Vec2(self.x - other.x, self.y - other.y)
-        
-    def __mul__(self, scalar):
-        return Vec2(self.x * scalar, self.y * scalar)
-    
-    def __eq__(self, other):
-        return abs(self.x - other.x) < 0.001 and abs(self.y - other.y) < 0.001
-    
-    def __hash__(self):
-        return hash((round(self.x, 3), round(self.y, 3)))
+    # Tunnel wrap-around
+    if x < -0.5:
+        x = 27.5
+    elif x >= 28.5:
+        x = 0.5
+    return x, y, moved
+
+def build_mode_schedule(level):
+    """Scatter/Chase cycle (Arcade timings) as frame counts where each phase ends.
+    bisect_right(thresholds, mode_timer) indexes modes; the last mode lasts forever."""
+    if level >= 5:
+        # Simple level scaling for timings (Arcade speeds up modes later)
+        durations = [5 * FPS, 20 * FPS, 5 * FPS, 20 * FPS, 5 * FPS, 1033 * FPS, 1] # 1033s: effectively forever
+    else:
+        # Level 1 timings
+        durations = [7 * FPS, 20 * FPS, 7 * FPS, 20 * FPS, 5 * FPS, 20 * FPS, 5 * FPS]
     
-    def dist_sq(self, other):
-        return (self.x - other.x)**2 + (self.y - other.y)**2
-        
-    def as_int(self):
-        return (int(self.x), int(self.y))
-        
-    def __repr__(self):
-        return f"({self.x:.2f}, {self.y:.2f})"
+    thresholds = []
+    end = 0
+    for duration in durations:
+        end += duration
+        thresholds.append(end)
+    return thresholds, ["SCATTER", "CHASE"] * 4
 
+# Headings as plain (dx, dy) tuples: equality is a C-level tuple compare
 DIRS = {
-    "NONE": Vec2(0, 0),
-    "UP": Vec2(0, -1),
-    "DOWN": Vec2(0, 1),
-    "LEFT": Vec2(-1, 0),
-    "RIGHT": Vec2(1, 0)
+    "NONE": (0, 0),
+    "UP": (0, -1),
+    "DOWN": (0, 1),
+    "LEFT": (-1, 0),
+    "RIGHT": (1, 0)
+}
+
+# Ghost move candidates in tie-break order; bit i of an availability mask is GHOST_DIRS[i]
+GHOST_DIRS = (DIRS["UP"], DIRS["DOWN"], DIRS["LEFT"], DIRS["RIGHT"])
+# (dx, dy) of a heading -> mask bit of the opposite direction
+REVERSE_BITS = {(-dx, -dy): 1 << i for i, (dx, dy) in enumerate(GHOST_DIRS)}
+
+# Arrow keys and WASD steer Pac-Man
+KEY_TO_DIR = {
+    pygame.K_UP: DIRS["UP"], pygame.K_w: DIRS["UP"],
+    pygame.K_DOWN: DIRS["DOWN"], pygame.K_s: DIRS["DOWN"],
+    pygame.K_LEFT: DIRS["LEFT"], pygame.K_a: DIRS["LEFT"],
+    pygame.K_RIGHT: DIRS["RIGHT"], pygame.K_d: DIRS["RIGHT"]
+}
+
+# Pixel nudge of a ghost's eyes toward where it is looking
+EYE_OFFSETS = {
+    DIRS["LEFT"]: (-2 * SCALE, 0),
+    DIRS["RIGHT"]: (2 * SCALE, 0),
+    DIRS["UP"]: (0, -2 * SCALE),
+    DIRS["DOWN"]: (0, 2 * SCALE)
 }
 
 class SoundSynthesizer:
@@ -115,42 +196,36 @@ class SoundSynthesizer:
     def generate_square_wave(freq, duration, volume, decay=0.0):
         """Generate a retro square wave sound buffer."""
         n_samples = int(SAMPLE_RATE * duration)
-        buf = array.array('h', [0] * n_samples)
+        i = np.arange(n_samples)
         
         period = int(SAMPLE_RATE / freq) if freq > 0 else 1
         amplitude = int(32767 * volume)
         
-        for i in range(n_samples):
-            # Apply decay
-            current_amp = amplitude
-            if decay > 0:
-                current_amp = int(amplitude * (1.0 - (i / n_samples) * decay))
-            
-            # Square wave logic
-            if period > 0 and (i // (period // 2)) % 2 == 0:
-                buf[i] = current_amp
-            else:
-                buf[i] = -current_amp
-                
+        # Apply decay (truncated per sample like the int16 output)
+        if decay > 0:
+            current_amp = (amplitude * (1.0 - (i / n_samples) * decay)).astype(np.int16)
+        else:
+            current_amp = np.full(n_samples, amplitude, dtype=np.int16)
+        
+        # Square wave logic: high on even half-periods
+        high = (i // (period // 2)) % 2 == 0
+        buf = np.where(high, current_amp, -current_amp)
         return pygame.mixer.Sound(buffer=buf)
 
     @staticmethod
     def generate_siren(start_freq, end_freq, duration, volume):
         """Generate a rising/falling siren sound."""
         n_samples = int(SAMPLE_RATE * duration)
-        buf = array.array('h', [0] * n_samples)
-        amplitude = int(32767 * volume)
+        i = np.arange(n_samples)
+        amplitude = np.int16(32767 * volume)
         
-        for i in range(n_samples):
-            t = i / n_samples
-            # Wobbly siren frequency
-            freq = start_freq + (end_freq - start_freq) * math.sin(t * math.pi * 10) 
-            period = int(SAMPLE_RATE / freq) if freq > 0 else 1
-            
-            if period > 0 and (i // (period // 2)) % 2 == 0:
-                buf[i] = amplitude
-            else:
-                buf[i] = -amplitude
+        t = i / n_samples
+        # Wobbly siren frequency
+        freq = start_freq + (end_freq - start_freq) * np.sin(t * math.pi * 10)
+        period = (SAMPLE_RATE / freq).astype(np.int64)
+        
+        high = (i // (period // 2)) % 2 == 0
+        buf = np.where(high, amplitude, -amplitude)
         return pygame.mixer.Sound(buffer=buf)
 
 # ---------------------------------------------------------------------------
@@ -159,33 +234,32 @@ class SoundSynthesizer:
 
 class Actor:
     def __init__(self, x, y, speed_base):
-        self.pos = Vec2(x + 0.5, y + 0.5)
+        # Position as plain floats: per-frame math stays allocation-free
+        self.x = x + 0.5
+        self.y = y + 0.5
         self.dir = DIRS["NONE"]
         self.next_dir = DIRS["NONE"]
         self.speed_base = speed_base
         self.radius = 0.4
         self.angle = 180  # Degrees
         
-    def can_move(self, walls, direction):
-        target = self.pos + direction * 0.5 # Look ahead half a tile
-        tx, ty = int(target.x), int(target.y)
-        
-        # Tunnel check
-        if tx < 0 or tx >= 28:
-            return True
-            
-        # Specific gate logic: Only ghosts in "dead" or "exit" mode can cross (13,12) and (14,12)
-        if (tx, ty) == (13, 12) or (tx, ty) == (14, 12):
-            return False 
-            
-        return (tx, ty) not in walls
+    def can_move(self, tilemap, direction):
+        # Look ahead half a tile
+        dx, dy = direction
+        tx, ty = int(self.x + dx * 0.5), int(self.y + dy * 0.5)
+
+        # Gate logic: Only ghosts in "dead" or "exit" mode can cross the gate,
+        # and they bypass can_move to do so
+        return not tile_at(tilemap, tx, ty) & (WALL_BIT | GATE_BIT)
 
     def align_to_grid(self):
         """Snap to center of tile axis opposite to movement"""
-        if self.dir.x != 0:
-            self.pos.y = math.floor(self.pos.y) + 0.5
-        elif self.dir.y != 0:
-            self.pos.x = math.floor(self.pos.x) + 0.5
+        # int() truncates toward zero, so step down for the tunnel's negative x
+        dx, dy = self.dir
+        if dx != 0:
+            self.y = int(self.y) + 0.5 if self.y >= 0 else int(self.y) - 0.5
+        elif dy != 0:
+            self.x = int(self.x) + 0.5 if self.x >= 0 else int(self.x) - 0.5
 
 class Pacman(Actor):
     def __init__(self):
@@ -198,21 +272,20 @@ class Pacman(Actor):
         self.next_dir = DIRS["LEFT"]
         self.freeze_timer = 0 # For eating pause
         
-    def update(self, walls, speed_mod):
+    def update(self, tilemap, speed_mod):
         # Handle eating pause (Arcade pauses 1 frame for pellet, 3 for power)
         if self.freeze_timer > 0:
             self.freeze_timer -= 1
             return
 
         # Change direction if next dir is valid
-        if self.next_dir.x != 0 or self.next_dir.y != 0:
-            if self.can_move(walls, self.next_dir):
+        if self.next_dir != DIRS["NONE"]:
+            if self.can_move(tilemap, self.next_dir):
                 # Only turn if close to center to prevent corner cutting glitches
-                dist_to_center = 0
-                if self.next_dir.x != 0:
-                    dist_to_center = abs(self.pos.y - (int(self.pos.y) + 0.5))
+                if self.next_dir[0] != 0:
+                    dist_to_center = abs(self.y - (int(self.y) + 0.5))
                 else:
-                    dist_to_center = abs(self.pos.x - (int(self.pos.x) + 0.5))
+                    dist_to_center = abs(self.x - (int(self.x) + 0.5))
                 
                 # Famicom has slightly more forgiving cornering than Arcade
                 if dist_to_center < 0.20: 
@@ -220,23 +293,18 @@ class Pacman(Actor):
                     self.align_to_grid()
             else:
                 # Keep trying current dir
-                if not self.can_move(walls, self.dir):
+                if not self.can_move(tilemap, self.dir):
                     self.dir = DIRS["NONE"]
         
-        # Move if direction is valid
-        if self.can_move(walls, self.dir):
-            self.pos += self.dir * (self.speed_base * speed_mod)
+        # Move if direction is valid (tunnel wrap-around included)
+        dx, dy = self.dir
+        self.x, self.y, moved = step_actor(self.x, self.y, dx, dy, self.speed_base * speed_mod, tilemap, False)
+        if moved:
             self.mouth_speed = 4 # Animate when moving
         else:
             self.mouth_speed = 0 # Stop animation when stuck
             self.mouth_angle = 45 # Open mouth when stuck
             
-        # Tunnel wrap-around
-        if self.pos.x < -0.5:
-            self.pos.x = 27.5
-        elif self.pos.x >= 28.5:
-            self.pos.x = 0.5
-            
         # Update mouth animation
         if self.mouth_speed > 0:
             if self.mouth_closing:
@@ -265,101 +333,111 @@ class Ghost(Actor):
         super().__init__(x, y, speed_base=0.14)
         self.base_color = color # FIXED: Persist identity
         self.color = color
-        self.home_tile = Vec2(x, y)
-        self.target_tile = Vec2(0, 0)
+        self.home_tile = (x, y)
+        self.target_x, self.target_y = 0, 0
         self.behavior_mode = behavior_mode
         self.mode_timer = 0
         self.frightened_timer = 0
         self.release_timer = 0
         self.is_in_house = True
         self.is_eaten = False
+        self.speed = 0.5 # Starts in the house (see update_speed)
         self.eye_dir = DIRS["LEFT"]
         
-    def set_target(self, pacman_pos, blinky_pos=None, pacman_dir=None):
+    def set_target(self, pac_x, pac_y, pacman_dir, blinky_x, blinky_y):
         if self.is_eaten:
-            self.target_tile = Vec2(13, 11) # Ghost House center
+            self.target_x, self.target_y = 13, 11 # Ghost House center
             return
             
         if self.behavior_mode == "FRIGHTENED":
-            # Pseudo-random target for frightened
-            self.target_tile = Vec2(random.randint(0, 27), random.randint(0, 30))
+            # Pseudo-random target for frightened: both coords from one 10-bit draw
+            r = random.getrandbits(10)
+            self.target_x, self.target_y = (r & 31) % 28, (r >> 5) % 31
             return
             
         if self.behavior_mode == "SCATTER":
             # Arcade-Accurate Scatter Targets
-            if self.base_color == COLOR_BLINKY: self.target_tile = Vec2(25, -3) # Top Right
-            elif self.base_color == COLOR_PINKY: self.target_tile = Vec2(2, -3) # Top Left
-            elif self.base_color == COLOR_INKY: self.target_tile = Vec2(27, 31) # Bottom Right
-            elif self.base_color == COLOR_CLYDE: self.target_tile = Vec2(0, 31) # Bottom Left
+            if self.base_color == COLOR_BLINKY: self.target_x, self.target_y = 25, -3 # Top Right
+            elif self.base_color == COLOR_PINKY: self.target_x, self.target_y = 2, -3 # Top Left
+            elif self.base_color == COLOR_INKY: self.target_x, self.target_y = 27, 31 # Bottom Right
+            elif self.base_color == COLOR_CLYDE: self.target_x, self.target_y = 0, 31 # Bottom Left
             return
 
-        tx, ty = int(pacman_pos.x), int(pacman_pos.y)
+        tx, ty = int(pac_x), int(pac_y)
+        pdx, pdy = pacman_dir
         
         # CHASE TARGETING LOGIC
         if self.base_color == COLOR_BLINKY:
-            self.target_tile = Vec2(tx, ty)
+            self.target_x, self.target_y = tx, ty
             
         elif self.base_color == COLOR_PINKY:
             # 1:1 ARCADE BUG: If Pac-Man is facing UP, Pinky also targets 4 tiles LEFT (Overflow)
-            offset_vec = pacman_dir if pacman_dir else DIRS["LEFT"]
-            target = Vec2(tx, ty) + (offset_vec * 4)
+            target_x = tx + pdx * 4
             if pacman_dir == DIRS["UP"]:
-                target.x -= 4 # Arcade overflow bug
-            self.target_tile = target
+                target_x -= 4 # Arcade overflow bug
+            self.target_x, self.target_y = target_x, ty + pdy * 4
                 
         elif self.base_color == COLOR_INKY:
-            if blinky_pos and pacman_dir:
-                # 1:1 ARCADE BUG: Same UP/LEFT overflow applies to the intermediate point for Inky
-                offset_vec = pacman_dir * 2
-                pivot = Vec2(tx, ty) + offset_vec
-                if pacman_dir == DIRS["UP"]:
-                    pivot.x -= 2 # Arcade overflow bug
-                
-                vec = pivot - blinky_pos
-                self.target_tile = pivot + vec
-            else:
-                self.target_tile = Vec2(tx, ty)
+            # 1:1 ARCADE BUG: Same UP/LEFT overflow applies to the intermediate point for Inky
+            pivot_x = tx + pdx * 2
+            pivot_y = ty + pdy * 2
+            if pacman_dir == DIRS["UP"]:
+                pivot_x -= 2 # Arcade overflow bug
+            
+            # Target is the pivot mirrored through Blinky
+            self.target_x = pivot_x + (pivot_x - blinky_x)
+            self.target_y = pivot_y + (pivot_y - blinky_y)
                 
         elif self.base_color == COLOR_CLYDE:
-            dist = self.pos.dist_sq(pacman_pos)
+            dist = (self.x - pac_x)**2 + (self.y - pac_y)**2
             if dist < 64: # 8 tiles squared
-                self.target_tile = Vec2(0, 31) # Scatter target
+                self.target_x, self.target_y = 0, 31 # Scatter target
             else:
-                self.target_tile = Vec2(tx, ty)
+                self.target_x, self.target_y = tx, ty
     
-    def choose_direction(self, walls, available_dirs):
-        if not available_dirs:
+    def choose_direction(self, mask):
+        """Pick a heading from a GHOST_DIRS availability bitmask"""
+        if not mask:
             return DIRS["NONE"]
-            
-        reverse_dir = Vec2(-self.dir.x, -self.dir.y)
+        
+        # Standard Red/Pink/Blue/Orange logic: never reverse spontaneously
+        if mask & (mask - 1): # More than one option
+            mask &= ~REVERSE_BITS.get(self.dir, 0)
         
         # Frightened: Random turn
         if self.behavior_mode == "FRIGHTENED":
-            candidates = [d for d in available_dirs if not (d == reverse_dir and len(available_dirs) > 1)]
-            return random.choice(candidates) if candidates else random.choice(available_dirs)
+            return random.choice([d for i, d in enumerate(GHOST_DIRS) if mask >> i & 1])
         
-        # Normal Pathfinding: Minimize distance to target
+        # Normal Pathfinding: Minimize distance to target (first direction wins ties)
+        x, y, tx, ty = self.x, self.y, self.target_x, self.target_y
         best_dir = None
-        best_dist = float('inf')
+        best_dist = 0.0
+        for i, d in enumerate(GHOST_DIRS):
+            if mask >> i & 1:
+                dx, dy = d
+                dist = (x + dx - tx)**2 + (y + dy - ty)**2
+                if best_dir is None or dist < best_dist:
+                    best_dist = dist
+                    best_dir = d
         
-        # Standard Red/Pink/Blue/Orange logic: never reverse spontaneously
-        for d in available_dirs:
-            if d == reverse_dir and len(available_dirs) > 1:
-                continue
-            
-            test_pos = self.pos + d
-            dist = test_pos.dist_sq(self.target_tile)
-            if dist < best_dist:
-                best_dist = dist
-                best_dir = d
-                
-        return best_dir if best_dir else available_dirs[0]
+        return best_dir
+    
+    def update_speed(self, speed_mod):
+        """Cache the per-frame speed. Call whenever frightened/eaten/house state
+        or the level speed changes; only Elroy and tunnels vary frame to frame."""
+        if self.is_in_house:
+            self.speed = 0.5 # Moving inside house
+            return
+        speed = self.speed_base * speed_mod
+        if self.behavior_mode == "FRIGHTENED": speed *= 0.6
+        if self.is_eaten: speed *= 2.0
+        self.speed = speed
     
     def reverse_direction(self):
         """Force 180 degree turn immediately."""
-        self.dir = Vec2(-self.dir.x, -self.dir.y)
+        self.dir = (-self.dir[0], -self.dir[1])
     
-    def update(self, game, walls, pacman_pos, pacman_dir, blinky_pos, speed_mod, level):
+    def update(self, game, tilemap, pac_x, pac_y, pacman_dir, blinky_x, blinky_y, speed_mod):
         prev_mode = self.behavior_mode
         
         # --- Mode Timer Logic ---
@@ -369,40 +447,11 @@ class Ghost(Actor):
                 self.behavior_mode = "CHASE" # Default return to chase
                 if not self.is_eaten:
                     self.color = self.base_color # FIXED: Restore base color
+                self.update_speed(speed_mod)
         elif not self.is_eaten:
             # Standard Scatter/Chase Cycle (Arcade Timings)
             self.mode_timer += 1
-            # Level 1 timings
-            cycle_times = [
-                (7, "SCATTER"), (20, "CHASE"),
-                (7, "SCATTER"), (20, "CHASE"),
-                (5, "SCATTER"), (20, "CHASE"),
-                (5, "SCATTER"), (-1, "CHASE")
-            ]
-            
-            # Simple level scaling for timings (Arcade speeds up modes later)
-            if level >= 5:
-                 cycle_times = [
-                    (5, "SCATTER"), (20, "CHASE"),
-                    (5, "SCATTER"), (20, "CHASE"),
-                    (5, "SCATTER"), (1033, "CHASE"), # effectively forever
-                    (1/60, "SCATTER"), (-1, "CHASE")
-                ]
-
-            current_time = self.mode_timer / FPS
-            accumulated_time = 0
-            target_mode = "CHASE"
-            
-            for duration, mode in cycle_times:
-                if duration == -1:
-                    target_mode = mode
-                    break
-                accumulated_time += duration
-                if current_time < accumulated_time:
-                    target_mode = mode
-                    break
-            
-            self.behavior_mode = target_mode
+            self.behavior_mode = game.mode_names[bisect.bisect_right(game.mode_thresholds, self.mode_timer)]
 
         # --- Reversal Logic ---
         # FIXED: Ghosts must reverse direction when switching modes (Scatter <-> Chase)
@@ -418,76 +467,65 @@ class Ghost(Actor):
             release_time = [0, 2, 6, 10][[COLOR_BLINKY, COLOR_PINKY, COLOR_INKY, COLOR_CLYDE].index(self.base_color)] * FPS
             if self.release_timer > release_time:
                 self.is_in_house = False
-                self.pos = Vec2(13.5, 11) # Exit house
+                self.x, self.y = 13.5, 11.0 # Exit house
+                self.update_speed(speed_mod)
         
         # Set Target
-        self.set_target(pacman_pos, blinky_pos, pacman_dir)
+        self.set_target(pac_x, pac_y, pacman_dir, blinky_x, blinky_y)
         
         # --- Movement Logic ---
-        available_dirs = []
-        for dname, dvec in DIRS.items():
-            if dname != "NONE":
+        # Decision point: Center of tile (truncated once, reused for the snap)
+        center_x = int(self.x) + 0.5
+        center_y = int(self.y) + 0.5
+        
+        if abs(self.x - center_x) < 0.15 and abs(self.y - center_y) < 0.15:
+            mask = 0
+            for i, (dx, dy) in enumerate(GHOST_DIRS):
                 # Special House Gate Logic check
-                target = self.pos + dvec * 0.5
-                tx, ty = int(target.x), int(target.y)
-                is_gate = (tx, ty) == (13, 12) or (tx, ty) == (14, 12)
+                tile = tile_at(tilemap, int(self.x + dx * 0.5), int(self.y + dy * 0.5))
                 
                 # Can only enter gate if eaten or exiting house
-                if is_gate:
+                if tile & GATE_BIT:
                     if self.is_eaten or self.is_in_house:
-                         available_dirs.append(dvec)
-                elif self.can_move(walls, dvec):
-                    available_dirs.append(dvec)
-        
-        # Decision point: Center of tile
-        if available_dirs:
-            dx = abs(self.pos.x - (int(self.pos.x) + 0.5))
-            dy = abs(self.pos.y - (int(self.pos.y) + 0.5))
+                        mask |= 1 << i
+                elif not tile & WALL_BIT:
+                    mask |= 1 << i
             
-            if dx < 0.15 and dy < 0.15:
-                self.pos.x = int(self.pos.x) + 0.5
-                self.pos.y = int(self.pos.y) + 0.5
-                self.dir = self.choose_direction(walls, available_dirs)
+            if mask:
+                self.x, self.y = center_x, center_y
+                self.dir = self.choose_direction(mask)
         
         # Move
-        current_speed_vec = self.dir * 0
-        if self.can_move(walls, self.dir) or (self.is_eaten and ((int(self.pos.x), int(self.pos.y)) in [(13,12), (14,12)])):
-            speed = self.speed_base * speed_mod
-            
-            # Cruise Elroy (Blinky Speeds up when dots are low)
-            if self.base_color == COLOR_BLINKY and self.behavior_mode == "CHASE" and not self.is_eaten:
-                dots_left = len(game.pellets) + len(game.power_pellets)
-                # Thresholds approximate Level 1
-                if dots_left < 20: # Elroy 2
-                    speed *= 1.10
-                elif dots_left < 40: # Elroy 1
-                    speed *= 1.05
-
-            if self.behavior_mode == "FRIGHTENED": speed *= 0.6
-            if self.is_eaten: speed *= 2.0
-            if self.is_in_house: speed = 0.5 # Moving inside house
-            
-            # Tunnel Slowdown (Ghosts move at ~50% speed in tunnels)
-            if int(self.pos.y) == 14 and (self.pos.x < 5 or self.pos.x > 22):
-                speed *= 0.5
-
-            current_speed_vec = self.dir * speed
-            self.pos += current_speed_vec
-            
-        # Tunnel Wrap
-        if self.pos.x < -0.5: self.pos.x = 27.5
-        elif self.pos.x >= 28.5: self.pos.x = 0.5
+        speed = self.speed
+        
+        # Cruise Elroy (Blinky Speeds up when dots are low)
+        if self.base_color == COLOR_BLINKY and self.behavior_mode == "CHASE" and not self.is_eaten and not self.is_in_house:
+            # Thresholds approximate Level 1
+            if game.dots_remaining < 20: # Elroy 2
+                speed *= 1.10
+            elif game.dots_remaining < 40: # Elroy 1
+                speed *= 1.05
+        
+        # Tunnel Slowdown (Ghosts move at ~50% speed in tunnels)
+        if int(self.y) == 14 and (self.x < 5 or self.x > 22):
+            speed *= 0.5
+        
+        # Eaten ghosts may pass through the gate tile they are standing on
+        on_gate = self.is_eaten and bool(tile_at(tilemap, int(self.x), int(self.y)) & GATE_BIT)
+        dx, dy = self.dir
+        self.x, self.y, _ = step_actor(self.x, self.y, dx, dy, speed, tilemap, on_gate)
         
         self.eye_dir = self.dir
         
         # --- Resurrection Logic ---
         if self.is_eaten:
             # Reached house center
-            if abs(self.pos.x - 13.5) < 1.0 and abs(self.pos.y - 11) < 1.0:
+            if abs(self.x - 13.5) < 1.0 and abs(self.y - 11) < 1.0:
                 self.is_eaten = False
                 self.behavior_mode = "CHASE"
                 self.color = self.base_color # FIXED: Restore base color
                 self.dir = DIRS["LEFT"] # Exit house direction
+                self.update_speed(speed_mod)
 
 # ---------------------------------------------------------------------------
 # GAME STATE
@@ -500,19 +538,17 @@ class Game:
         self.high_score = 10000
         self.lives = 3
         self.extra_life_given = False
-        self.pellets = set()
-        self.power_pellets = set()
-        self.walls = set()
         self.fruit_spawned = False
         self.fruit_timer = 0
         self.fruit_type = 0
-        self.fruit_pos = Vec2(13.5, 17.5)
+        self.fruit_pos = (13.5, 17.5)
         self.game_over = False
         self.paused = False
         self.frightened_mode = False
         self.frightened_timer = 0
         self.ghost_eaten_multiplier = 1
         self.combo_timer = 0
+        self.mode_thresholds, self.mode_names = build_mode_schedule(self.level)
         self.init_maze()
         
         self.pacman = Pacman()
@@ -524,6 +560,11 @@ class Game:
         ]
         
         self.sounds = self.generate_sounds()
+        # Dedicated channels for the frequent chirps: no free-channel scan per
+        # pellet, and a new chirp cuts off the previous one like the arcade
+        pygame.mixer.set_reserved(2)
+        self.ch_pellet = pygame.mixer.Channel(0)
+        self.ch_power = pygame.mixer.Channel(1)
         
     def generate_sounds(self):
         return {
@@ -537,19 +578,34 @@ class Game:
     
     def init_maze(self):
         """Initialize maze walls, pellets, and power pellets from layout"""
-        self.walls.clear()
-        self.pellets.clear()
-        self.power_pellets.clear()
-        
-        for y, row in enumerate(MAZE_LAYOUT):
-            for x, char in enumerate(row):
-                pos = (x, y)
-                if char == '#':
-                    self.walls.add(pos)
-                elif char == '.':
-                    self.pellets.add(pos)
-                elif char == 'o':
-                    self.power_pellets.add(pos)
+        self.tilemap = MAZE_TILEMAP.copy()
+        self.count_dots()
+        self.render_maze()
+
+    def render_maze(self):
+        """Pre-render walls and pellets once; eating a pellet just erases its tile"""
+        size = (MAZE_COLS * TILE_SIZE * SCALE, MAZE_ROWS * TILE_SIZE * SCALE)
+        # Display pixel format up front, so the per-frame blits are straight copies
+        self.wall_surface = pygame.Surface(size).convert()
+        for y, x in np.argwhere(self.tilemap & WALL_BIT).tolist():
+            rect = tile_rect(x, y)
+            pygame.draw.rect(self.wall_surface, COLOR_WALL, rect)
+            if MAZE_LAYOUT[y][x] == '#':
+                pygame.draw.rect(self.wall_surface, (66, 66, 255), rect.inflate(-4 * SCALE, -4 * SCALE))
+
+        self.pellet_surface = pygame.Surface(size).convert()
+        self.pellet_surface.set_colorkey(COLOR_BLACK)
+        for y, x in np.argwhere(self.tilemap & PELLET_BIT).tolist():
+            pygame.draw.circle(self.pellet_surface, COLOR_PELLET, tile_rect(x, y).center, 2 * SCALE)
+        # Tiles erased from pellet_surface since the renderer last looked
+        self.eaten_rects = []
+        
+        # Power pellets pulse, so they stay a short list of centers drawn per frame
+        self.power_centers = [tile_rect(x, y).center for y, x in np.argwhere(self.tilemap & POWER_BIT).tolist()]
+
+    def count_dots(self):
+        """Recount pellets + power pellets; eating keeps dots_remaining in step"""
+        self.dots_remaining = int(np.count_nonzero(self.tilemap & (PELLET_BIT | POWER_BIT)))
     
     def get_speed_mod(self):
         """Calculate speed multiplier based on level"""
@@ -560,17 +616,23 @@ class Game:
     
     def check_collisions(self):
         """Handle Pac-Man collisions with pellets, ghosts, and fruit"""
-        px, py = int(self.pacman.pos.x), int(self.pacman.pos.y)
+        pac_x, pac_y = self.pacman.x, self.pacman.y
+        px, py = int(pac_x), int(pac_y)
         
-        # Check pellet (using set lookup for O(1))
-        if (px, py) in self.pellets:
-            self.pellets.remove((px, py))
+        # Check pellet (single byte lookup in the tilemap)
+        tile = tile_at(self.tilemap, px, py)
+        if tile & PELLET_BIT:
+            self.tilemap[py, px] = tile & ~PELLET_BIT
+            rect = tile_rect(px, py)
+            self.pellet_surface.fill(COLOR_BLACK, rect)
+            self.eaten_rects.append(rect)
+            self.dots_remaining -= 1
             self.score += 10
-            self.sounds['eat_pellet'].play()
+            self.ch_pellet.play(self.sounds['eat_pellet'])
             self.pacman.freeze_timer = 1 # Slight eating delay
             
-            # Level 256 glitch logic
-            if self.level == 256 and len(self.pellets) == 0:
+            # Level 256 glitch logic: regular pellets only (power pellets don't count here)
+            if self.level == 256 and not np.any(self.tilemap & PELLET_BIT):
                 self.level_up()
             
             if not self.extra_life_given and self.score >= 10000:
@@ -578,19 +640,24 @@ class Game:
                 self.extra_life_given = True
         
         # Check power pellet
-        if (px, py) in self.power_pellets:
-            self.power_pellets.remove((px, py))
+        tile = tile_at(self.tilemap, px, py)
+        if tile & POWER_BIT:
+            self.tilemap[py, px] = tile & ~POWER_BIT
+            self.power_centers.remove(tile_rect(px, py).center)
+            self.dots_remaining -= 1
             self.score += 50
-            self.sounds['eat_power'].play()
+            self.ch_power.play(self.sounds['eat_power'])
             self.pacman.freeze_timer = 3 # Longer delay for power pellets
             self.frightened_mode = True
             self.frightened_timer = 6 * FPS  # 6 seconds
             self.ghost_eaten_multiplier = 1
+            speed_mod = self.get_speed_mod()
             
             for ghost in self.ghosts:
                 if not ghost.is_eaten:
                     ghost.behavior_mode = "FRIGHTENED"
                     ghost.frightened_timer = self.frightened_timer
+                    ghost.update_speed(speed_mod)
                     # Flip direction immediately when frightened
                     ghost.reverse_direction()
         
@@ -604,10 +671,11 @@ class Game:
         # Check ghost collisions
         for ghost in self.ghosts:
             # Simple circle/box collision
-            if ghost.pos.dist_sq(self.pacman.pos) < 1.0:
+            if (ghost.x - pac_x)**2 + (ghost.y - pac_y)**2 < 1.0:
                 if ghost.behavior_mode == "FRIGHTENED" and not ghost.is_eaten:
                     ghost.is_eaten = True
                     ghost.behavior_mode = "CHASE"
+                    ghost.update_speed(self.get_speed_mod())
                     points = 200 * self.ghost_eaten_multiplier
                     self.score += points
                     self.ghost_eaten_multiplier *= 2
@@ -625,14 +693,16 @@ class Game:
     
     def reset_positions(self):
         """Reset actors for new life/level"""
-        self.pacman.pos = Vec2(13.5, 23.5)
+        self.pacman.x, self.pacman.y = 13.5, 23.5
         self.pacman.dir = DIRS["LEFT"]
         self.pacman.next_dir = DIRS["LEFT"]
         
         positions = [(13, 11), (13, 14), (11, 14), (15, 14)]
+        speed_mod = self.get_speed_mod()
         
         for i, ghost in enumerate(self.ghosts):
-            ghost.pos = Vec2(positions[i][0] + 0.5, positions[i][1] + 0.5)
+            ghost.x = positions[i][0] + 0.5
+            ghost.y = positions[i][1] + 0.5
             ghost.dir = DIRS["LEFT"]
             ghost.is_eaten = False
             ghost.behavior_mode = "SCATTER"
@@ -640,12 +710,14 @@ class Game:
             ghost.is_in_house = (i > 0)
             ghost.release_timer = 0
             ghost.color = ghost.base_color # Ensure color reset
+            ghost.update_speed(speed_mod)
         
         self.frightened_mode = False
         self.frightened_timer = 0
     
     def level_up(self):
         self.level += 1
+        self.mode_thresholds, self.mode_names = build_mode_schedule(self.level)
         if self.level == 256:
             self.apply_kill_screen_glitch()
         else:
@@ -659,23 +731,28 @@ class Game:
     
     def apply_kill_screen_glitch(self):
         """Memory corruption style glitch for Level 256"""
-        for y in range(len(MAZE_LAYOUT)):
-            for x in range(14, 28):
-                if random.random() > 0.4: self.walls.add((x, y))
-                else: self.walls.discard((x, y))
-                if (x, y) not in self.walls and random.random() > 0.6:
-                    self.pellets.add((x, y))
+        # Right half of the maze, rewritten in bulk (a view into the tilemap)
+        half = self.tilemap[:, 14:]
+        walls = np.random.random(half.shape) > 0.4
+        pellets = ~walls & (np.random.random(half.shape) > 0.6)
+        half &= ~WALL_BIT & 0xFF
+        half |= walls.astype(np.uint8) * WALL_BIT | pellets.astype(np.uint8) * PELLET_BIT
+        self.count_dots()
+        self.render_maze()
     
     def update(self):
         if self.game_over or self.paused: return
         
         speed_mod = self.get_speed_mod()
         
-        self.pacman.update(self.walls, speed_mod)
+        self.pacman.update(self.tilemap, speed_mod)
         
-        blinky_pos = self.ghosts[0].pos
+        pacman = self.pacman
+        # Inky mirrors through Blinky's position as of the start of the frame
+        blinky = self.ghosts[0]
+        blinky_x, blinky_y = blinky.x, blinky.y
         for ghost in self.ghosts:
-            ghost.update(self, self.walls, self.pacman.pos, self.pacman.dir, blinky_pos, speed_mod, self.level)
+            ghost.update(self, self.tilemap, pacman.x, pacman.y, pacman.dir, blinky_x, blinky_y, speed_mod)
         
         self.check_collisions()
         
@@ -683,16 +760,18 @@ class Game:
             self.frightened_timer -= 1
             if self.frightened_timer <= 0:
                 self.frightened_mode = False
+                speed_mod = self.get_speed_mod()
                 for ghost in self.ghosts:
                     if not ghost.is_eaten:
                         ghost.behavior_mode = "CHASE"
                         ghost.color = ghost.base_color
+                        ghost.update_speed(speed_mod)
         
         if self.fruit_timer > 0:
             self.fruit_timer -= 1
             if self.fruit_timer == 0: self.fruit_spawned = True
         
-        if len(self.pellets) == 0 and len(self.power_pellets) == 0:
+        if self.dots_remaining == 0:
             self.level_up()
 
 # ---------------------------------------------------------------------------
@@ -705,127 +784,245 @@ class Renderer:
         pygame.font.init()
         self.font = pygame.font.SysFont('courier', 24 * SCALE // 3, bold=True)
         self.small_font = pygame.font.SysFont('courier', 16 * SCALE // 3)
+        # Every moving shape is a pre-rendered sprite, so a frame is blits only.
+        # Pac-Man sprites per (angle, mouth_angle, radius): the mouth only
+        # ever takes a couple dozen values, so each pose is drawn once
+        self.pac_cache = {}
+        # Ghost (sprite, half size) per (color, eye_dir, foot phase, radius); see draw_ghosts
+        self.ghost_cache = {}
+        # Power pellet radius per wave step, so the pulse needs no trig per frame
+        self.pulse_radii = [4 * SCALE + int(math.sin(i * 2 * math.pi / WAVE_STEPS) * 2) for i in range(WAVE_STEPS)]
+        self.power_sprites = {r: self.circle_sprite(COLOR_PELLET, r) for r in set(self.pulse_radii)}
+        self.fruit_sprites = [self.circle_sprite(color, 6 * SCALE) for color in FRUIT_COLORS]
+        self.wave = 0
         
-    def draw_maze(self, game):
-        for x, y in game.walls:
-            rect = pygame.Rect(x * TILE_SIZE * SCALE, y * TILE_SIZE * SCALE, TILE_SIZE * SCALE, TILE_SIZE * SCALE)
-            pygame.draw.rect(self.screen, COLOR_WALL, rect)
-            if MAZE_LAYOUT[y][x] == '#':
-                inner = rect.inflate(-4 * SCALE, -4 * SCALE)
-                pygame.draw.rect(self.screen, (66, 66, 255), inner)
+        # Static UI pieces are rendered once; the score and level text only when they change
+        self.life_icon = self.circle_sprite(COLOR_PACMAN, 5 * SCALE)
+        # Spare-life slots (icon top-left = circle center - radius); more than this never fit
+        self.life_positions = tuple((20 * SCALE + i * 15 * SCALE - 5 * SCALE, SCREEN_HEIGHT - 15 * SCALE) for i in range(8))
+        t = self.font.render("GAME OVER", True, COLOR_RED)
+        t2 = self.small_font.render("Press R to Restart", True, COLOR_WHITE)
+        self.game_over_blits = [
+            (t, (SCREEN_WIDTH//2 - t.get_width()//2, SCREEN_HEIGHT//2)),
+            (t2, (SCREEN_WIDTH//2 - t2.get_width()//2, SCREEN_HEIGHT//2 + 40))
+        ]
+        self.score_value = None
+        self.score_surface = None
+        self.level_value = None
+        self.level_blit = None
         
-        for x, y in game.pellets:
-            center = (x * TILE_SIZE * SCALE + TILE_SIZE * SCALE // 2, y * TILE_SIZE * SCALE + TILE_SIZE * SCALE // 2)
-            pygame.draw.circle(self.screen, COLOR_PELLET, center, 2 * SCALE)
-            
-        for x, y in game.power_pellets:
-            center = (x * TILE_SIZE * SCALE + TILE_SIZE * SCALE // 2, y * TILE_SIZE * SCALE + TILE_SIZE * SCALE // 2)
-            radius = 4 * SCALE + int(math.sin(pygame.time.get_ticks() * 0.01) * 2)
-            pygame.draw.circle(self.screen, COLOR_PELLET, center, radius)
+        # Dirty-rect state: the game/maze currently painted and what was drawn over it
+        self.background_game = None
+        self.background_maze = None
+        self.prev_rects = []
+        # Sprite blits for this frame in back-to-front order; flush() sends them in one call
+        self.blit_queue = []
+        self.draw_ghosts = self.ghost_drawer()
+        
+    @staticmethod
+    def circle_sprite(color, radius):
+        """Filled circle on a transparent square; blit at center - radius"""
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+        return surf.convert_alpha()
+
+    def begin_frame(self):
+        """Read the clock once per frame; every animation samples self.wave"""
+        self.wave = int(pygame.time.get_ticks() * 0.01 * WAVE_STEPS / (2 * math.pi)) % WAVE_STEPS
+
+    def draw_power_pellets(self, game):
+        # Power pellets pulse, so they are the only part drawn per frame
+        radius = self.pulse_radii[self.wave]
+        sprite = self.power_sprites[radius]
+        self.blit_queue += [(sprite, (cx - radius, cy - radius)) for cx, cy in game.power_centers]
+
+    def restore_maze(self, game, rects):
+        """Repaint the static maze (walls + uneaten pellets) under the given rects"""
+        fill, screen = self.screen.fill, self.screen
+        for rect in rects:
+            fill(COLOR_BLACK, rect)
+        screen.blits([(game.wall_surface, rect, rect) for rect in rects], doreturn=False)
+        screen.blits([(game.pellet_surface, rect, rect) for rect in rects], doreturn=False)
     
     def draw_pacman(self, pacman):
-        center = (pacman.pos.x * TILE_SIZE * SCALE, pacman.pos.y * TILE_SIZE * SCALE)
         radius = pacman.radius * TILE_SIZE * SCALE
+        key = (pacman.angle, max(pacman.mouth_angle, 0), radius)
+        sprite = self.pac_cache.get(key)
+        if sprite is None:
+            sprite = self.pac_cache[key] = self.render_pacman(*key)
+        
+        half = sprite.get_width() // 2
+        self.blit_queue.append((sprite, (int(pacman.x * TILE_SIZE * SCALE) - half, int(pacman.y * TILE_SIZE * SCALE) - half)))
+    
+    @classmethod
+    def render_pacman(cls, angle, mouth_angle, radius):
+        """One Pac-Man pose on a transparent sprite"""
+        half = int(radius) + 1
+        surf = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        center = (half, half)
         
         # FIXED: Optimized polygon drawing instead of full circle + mask
-        if pacman.mouth_angle <= 0:
-            pygame.draw.circle(self.screen, COLOR_PACMAN, center, radius)
+        if mouth_angle <= 0:
+            pygame.draw.circle(surf, COLOR_PACMAN, center, radius)
         else:
-            angle_rad = math.radians(pacman.angle)
-            mouth_rad = math.radians(pacman.mouth_angle)
-            
-            # Vertices for the pie slice
             points = [center]
-            steps = 20
-            # Draw the solid part (the pacman body)
-            # From (angle + mouth) around to (angle + 360 - mouth)
-            start_a = angle_rad + mouth_rad
-            end_a = angle_rad + 2 * math.pi - mouth_rad
-            
-            for i in range(steps + 1):
-                curr_a = start_a + (end_a - start_a) * (i / steps)
-                px = center[0] + radius * math.cos(curr_a)
-                py = center[1] + radius * math.sin(curr_a)
-                points.append((px, py))
-            
-            pygame.draw.polygon(self.screen, COLOR_PACMAN, points)
+            points += (cls.pacman_poly(angle, mouth_angle, radius) + half).tolist()
+            pygame.draw.polygon(surf, COLOR_PACMAN, points)
+        return surf.convert_alpha()
+    
+    @staticmethod
+    def pacman_poly(angle, mouth_angle, radius):
+        """Rim vertices of the pie slice relative to Pac-Man's center, as an (N, 2) array"""
+        angle_rad = math.radians(angle)
+        mouth_rad = math.radians(mouth_angle)
+        
+        steps = 20
+        # Draw the solid part (the pacman body)
+        # From (angle + mouth) around to (angle + 360 - mouth)
+        start_a = angle_rad + mouth_rad
+        end_a = angle_rad + 2 * math.pi - mouth_rad
+        
+        angles = np.linspace(start_a, end_a, steps + 1)
+        return np.column_stack((np.cos(angles), np.sin(angles))) * radius
     
-    def draw_ghost(self, ghost):
-        center = (ghost.pos.x * TILE_SIZE * SCALE, ghost.pos.y * TILE_SIZE * SCALE)
-        radius = ghost.radius * TILE_SIZE * SCALE
-        
-        if ghost.is_eaten: color = COLOR_WHITE
-        elif ghost.behavior_mode == "FRIGHTENED":
-            # Flashing near end of frightened time
-            if ghost.frightened_timer < 2 * FPS and (ghost.frightened_timer // 10) % 2:
-                color = COLOR_WHITE
+    def ghost_drawer(self):
+        """Build draw_ghosts(ghosts) specialised to this renderer: the cache, queue and
+        pixel scale are closure locals, so the per-ghost path does no attribute or constant lookups"""
+        renderer = self
+        cache, render = self.ghost_cache, self.render_ghost
+        queue_extend = self.blit_queue.extend
+        px = TILE_SIZE * SCALE
+        flash_time = 2 * FPS
+        phase_div = WAVE_STEPS // GHOST_FOOT_PHASES
+        white, frightened = COLOR_WHITE, COLOR_FRIGHTENED
+
+        def ghost_blit(ghost):
+            if ghost.is_eaten: color = None # Eyes only
+            elif ghost.behavior_mode == "FRIGHTENED":
+                # Flashing near end of frightened time
+                if ghost.frightened_timer < flash_time and (ghost.frightened_timer // 10) % 2:
+                    color = white
+                else:
+                    color = frightened
             else:
-                color = COLOR_FRIGHTENED
-        else:
-            color = ghost.color
+                color = ghost.color
+            
+            # Wavy feet: the wave phase is bucketed so each look is rendered once
+            phase = 0 if color is None else renderer.wave // phase_div
             
-        if not ghost.is_eaten:
+            key = (color, ghost.eye_dir, phase, ghost.radius)
+            entry = cache.get(key)
+            if entry is None:
+                sprite = render(color, ghost.eye_dir, phase, ghost.radius * px)
+                entry = cache[key] = (sprite, sprite.get_width() // 2)
+            
+            sprite, half = entry
+            return (sprite, (int(ghost.x * px) - half, int(ghost.y * px) - half))
+
+        def draw_ghosts(ghosts):
+            # The whole pack goes onto the queue in one extend
+            queue_extend(map(ghost_blit, ghosts))
+        return draw_ghosts
+    
+    @staticmethod
+    def render_ghost(color, eye_dir, phase, radius):
+        """One ghost look (body color or None when eaten, eyes, feet phase) on a transparent sprite"""
+        half = int(radius) + 10 # Room for the feet wave and looking pupils
+        surf = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        center = (half, half)
+        circle = pygame.draw.circle
+        
+        if color is not None:
             # Draw Dome
-            pygame.draw.circle(self.screen, color, center, radius)
+            circle(surf, color, center, radius)
             # Draw Feet (Rectangle to cover bottom of circle + waves)
             rect = pygame.Rect(center[0] - radius, center[1], radius * 2, radius)
-            pygame.draw.rect(self.screen, color, rect)
+            pygame.draw.rect(surf, color, rect)
             
             # Wavy feet
             feet = 3
             foot_w = (radius * 2) / feet
+            wave = phase * 2 * math.pi / GHOST_FOOT_PHASES
             for i in range(feet):
                 fx = center[0] - radius + i * foot_w
                 fy = center[1] + radius
-                offset = math.sin(pygame.time.get_ticks() * 0.01 + i) * 3
-                pygame.draw.circle(self.screen, color, (fx + foot_w/2, fy - offset), foot_w/2)
+                offset = math.sin(wave + i) * 3
+                circle(surf, color, (fx + foot_w/2, fy - offset), foot_w/2)
 
-        # Eyes
+        # Eyes: both sit eye_off_x either side of center, shifted toward the look direction
         eye_off_x = radius * 0.35
-        eye_off_y = -radius * 0.15
+        eye_y = center[1] - radius * 0.15
+        eye_r, pupil_r = radius * 0.3, radius * 0.15
         
         eye_color = COLOR_WHITE
         pupil_color = (0, 0, 255) # Blue pupils like arcade
         
         # Calculate eye position based on look direction
-        look_off_x, look_off_y = 0, 0
-        if ghost.eye_dir == DIRS["LEFT"]: look_off_x = -2 * SCALE
-        elif ghost.eye_dir == DIRS["RIGHT"]: look_off_x = 2 * SCALE
-        elif ghost.eye_dir == DIRS["UP"]: look_off_y = -2 * SCALE
-        elif ghost.eye_dir == DIRS["DOWN"]: look_off_y = 2 * SCALE
-        
-        # Draw Whites
-        pygame.draw.circle(self.screen, eye_color, (center[0] - eye_off_x + look_off_x, center[1] + eye_off_y + look_off_y), radius * 0.3)
-        pygame.draw.circle(self.screen, eye_color, (center[0] + eye_off_x + look_off_x, center[1] + eye_off_y + look_off_y), radius * 0.3)
+        look_off_x, look_off_y = EYE_OFFSETS.get(eye_dir, (0, 0))
         
-        # Draw Pupils
-        pygame.draw.circle(self.screen, pupil_color, (center[0] - eye_off_x + look_off_x * 1.5, center[1] + eye_off_y + look_off_y * 1.5), radius * 0.15)
-        pygame.draw.circle(self.screen, pupil_color, (center[0] + eye_off_x + look_off_x * 1.5, center[1] + eye_off_y + look_off_y * 1.5), radius * 0.15)
+        for side in (-eye_off_x, eye_off_x):
+            # Draw White, then Pupil (pupils look a bit further)
+            circle(surf, eye_color, (center[0] + side + look_off_x, eye_y + look_off_y), eye_r)
+            circle(surf, pupil_color, (center[0] + side + look_off_x * 1.5, eye_y + look_off_y * 1.5), pupil_r)
+        return surf.convert_alpha()
 
     def draw_fruit(self, game):
         if not game.fruit_spawned: return
-        center = (game.fruit_pos.x * TILE_SIZE * SCALE, game.fruit_pos.y * TILE_SIZE * SCALE)
-        colors = [(255,0,0), (255,180,180), (255,165,0), (255,0,0), (0,255,0), (255,255,0), (200,0,200), (255,255,255)]
-        color = colors[game.fruit_type % 8]
-        pygame.draw.circle(self.screen, color, center, 6 * SCALE)
+        fx, fy = game.fruit_pos
+        pos = (int(fx * TILE_SIZE * SCALE) - 6 * SCALE, int(fy * TILE_SIZE * SCALE) - 6 * SCALE)
+        self.blit_queue.append((self.fruit_sprites[game.fruit_type & 7], pos))
 
     def draw_ui(self, game):
-        score_t = self.font.render(f"SCORE: {game.score}", True, COLOR_WHITE)
-        self.screen.blit(score_t, (10, 5))
+        if game.score != self.score_value:
+            self.score_value = game.score
+            self.score_surface = self.font.render(f"SCORE: {game.score}", True, COLOR_WHITE)
+        blits = self.blit_queue
+        blits.append((self.score_surface, (10, 5)))
         
-        level_t = self.font.render(f"LEVEL: {min(game.level, 256)}", True, COLOR_WHITE)
-        self.screen.blit(level_t, (SCREEN_WIDTH - level_t.get_width() - 10, 5))
+        if game.level != self.level_value:
+            self.level_value = game.level
+            level_t = self.font.render(f"LEVEL: {min(game.level, 256)}", True, COLOR_WHITE)
+            self.level_blit = (level_t, (SCREEN_WIDTH - level_t.get_width() - 10, 5))
+        blits.append(self.level_blit)
         
         # Lives
-        for i in range(max(0, game.lives - 1)):
-            x = 20 * SCALE + i * 15 * SCALE
-            pygame.draw.circle(self.screen, COLOR_PACMAN, (x, SCREEN_HEIGHT - 10 * SCALE), 5 * SCALE)
+        icon = self.life_icon
+        blits += [(icon, pos) for pos in self.life_positions[:max(0, game.lives - 1)]]
             
         if game.game_over:
-            t = self.font.render("GAME OVER", True, COLOR_RED)
-            self.screen.blit(t, (SCREEN_WIDTH//2 - t.get_width()//2, SCREEN_HEIGHT//2))
-            t2 = self.small_font.render("Press R to Restart", True, COLOR_WHITE)
-            self.screen.blit(t2, (SCREEN_WIDTH//2 - t2.get_width()//2, SCREEN_HEIGHT//2 + 40))
+            blits += self.game_over_blits
+
+    def flush(self):
+        """Blit everything queued by the draw_* calls in one go; returns the rects touched"""
+        rects = self.screen.blits(self.blit_queue)
+        self.blit_queue.clear()
+        return rects
+
+    def draw_frame(self, game):
+        """Draw a frame, repainting only what changed since the last one.
+        Returns the rects to pass to display.update(), or None after a full redraw"""
+        self.begin_frame()
+        eaten, game.eaten_rects = game.eaten_rects, []
+        if self.background_game is not game or self.background_maze is not game.wall_surface:
+            # New game, new level or kill-screen maze: paint everything once
+            self.background_game, self.background_maze = game, game.wall_surface
+            self.restore_maze(game, [self.screen.get_rect()])
+            dirty = None
+        else:
+            # Erase last frame's sprites and any pellets eaten since
+            dirty = self.prev_rects + eaten
+            self.restore_maze(game, dirty)
+
+        # Back to front: pellets, fruit, ghosts, Pac-Man, UI
+        self.draw_power_pellets(game)
+        self.draw_fruit(game)
+        self.draw_ghosts(game.ghosts)
+        self.draw_pacman(game.pacman)
+        self.draw_ui(game)
+        rects = self.flush()
+        
+        self.prev_rects = rects
+        return None if dirty is None else dirty + rects
 
 # ---------------------------------------------------------------------------
 # MAIN
@@ -840,39 +1037,55 @@ def main():
     
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("PAC-MAN NES EDITION")
-    clock = pygame.time.Clock()
+    # Drop everything but quit/key presses at the SDL level (mouse motion etc.)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
     
     game = Game()
     renderer = Renderer(screen)
     game.sounds['start'].play()
     
+    step = 1.0 / FPS
+    accumulator = 0.0
+    last = frame_end = time.perf_counter()
     running = True
     while running:
-        for event in pygame.event.get():
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
             if event.type == pygame.QUIT: running = False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP or event.key == pygame.K_w: game.pacman.next_dir = DIRS["UP"]
-                elif event.key == pygame.K_DOWN or event.key == pygame.K_s: game.pacman.next_dir = DIRS["DOWN"]
-                elif event.key == pygame.K_LEFT or event.key == pygame.K_a: game.pacman.next_dir = DIRS["LEFT"]
-                elif event.key == pygame.K_RIGHT or event.key == pygame.K_d: game.pacman.next_dir = DIRS["RIGHT"]
+                direction = KEY_TO_DIR.get(event.key)
+                if direction is not None: game.pacman.next_dir = direction
                 elif event.key == pygame.K_r: 
                     game = Game()
                     game.sounds['start'].play()
                 elif event.key == pygame.K_p: game.paused = not game.paused
                 elif event.key == pygame.K_ESCAPE: running = False
 
-        if not game.paused:
-            game.update()
+        # Fixed timestep: run as many logic ticks as real time has covered
+        now = time.perf_counter()
+        accumulator = min(accumulator + now - last, MAX_FRAME_TIME)
+        last = now
+        while accumulator >= step:
+            if not game.paused:
+                game.update()
+            accumulator -= step
             
-        screen.fill(COLOR_BLACK)
-        renderer.draw_maze(game)
-        renderer.draw_fruit(game)
-        for ghost in game.ghosts: renderer.draw_ghost(ghost)
-        renderer.draw_pacman(game.pacman)
-        renderer.draw_ui(game)
-        
-        pygame.display.flip()
-        clock.tick(FPS)
+        # Only the regions that changed go to the display
+        dirty = renderer.draw_frame(game)
+        if dirty is None: pygame.display.flip()
+        else: pygame.display.update(dirty)
+        
+        # Hybrid pacing: sleep most of the frame (SDL sleeps in ~10ms steps on
+        # some platforms), then spin only the last SPIN_TIME to hit the deadline.
+        # Paused/game over screens skip the spin and just sleep.
+        frame_end += step
+        now = time.perf_counter()
+        if frame_end < now - step: frame_end = now # Far behind: the accumulator catches up, don't rush frames
+        idle = game.paused or game.game_over
+        sleep = frame_end - now - (0 if idle else SPIN_TIME)
+        if sleep > 0: pygame.time.wait(int(sleep * 1000))
+        if not idle:
+            while time.perf_counter() < frame_end: pass
 
     pygame.quit()
     sys.exit()